@@ -0,0 +1,111 @@
+"""
+A local HTTP server standing in for every government news website crawled by `source_scraping.py`, serving the pages
+of `fixtures.py` with configurable latency and error rates.
+
+The loaders keep requesting the live URLs. `install` mounts a transport adapter on the shared session that sends each
+request to the local server instead, so that requests still go through sockets, connection pools, retries and the
+per-host scheduler exactly as they would against the live websites, without any network access.
+"""
+
+import multiprocessing
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from requests.adapters import HTTPAdapter
+
+import fixtures
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1' # Keeps connections alive, like the live websites
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        settings = self.server.settings
+        url = self.path[1:] # Requested as /<original URL>
+
+        with self.server.lock:
+            rand = self.server.rand.random()
+            delay = settings['latency'] + self.server.rand.uniform(0, settings['jitter'])
+        time.sleep(delay)
+
+        if rand < settings['error_rate']:
+            status, content_type, body = 503, 'text/html; charset=utf-8', b'<html><body>Service unavailable</body></html>'
+        else:
+            status, content_type, _, body = fixtures.page(url)
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if status == 503 and settings['retry_after'] is not None:
+            self.send_header('Retry-After', str(settings['retry_after']))
+        self.end_headers()
+        self.wfile.write(body)
+
+def _serve(port, settings, ready):
+    server = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+    server.daemon_threads = True
+    server.settings = settings
+    server.lock = threading.Lock()
+    server.rand = random.Random(settings['seed'])
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+def start(latency=0.0, jitter=0.0, error_rate=0.0, retry_after=None, seed=0):
+    """
+    Parameters:
+        - `latency`
+            float, the number of seconds the server waits before answering each request
+        - `jitter`
+            float, the largest number of seconds added at random to `latency`
+        - `error_rate`
+            float, the fraction of requests answered with a 503 instead of the page
+        - `retry_after`
+            int, the number of seconds sent in the `Retry-After` header of 503 responses. By default, no header is sent.
+        - `seed`
+            int, the seed of the random latencies and errors, so that runs can be repeated
+
+    Starts the server in its own process, so that its CPU time is not counted as the loaders'.
+
+    Returns: a tuple containing the process running the server and the port it listens on
+    """
+    settings = dict(latency=latency, jitter=jitter, error_rate=error_rate, retry_after=retry_after, seed=seed)
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(0, settings, ready), daemon=True)
+    process.start()
+    return process, ready.get(timeout=30)
+
+class _LocalAdapter(HTTPAdapter):
+    """
+    Sends every request to the local server at `port`, under a path made of the original URL, and counts the requests and bytes received
+    """
+
+    def __init__(self, port, **kwargs):
+        self.port = port
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.bytes = 0
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        request.url = 'http://127.0.0.1:{}/{}'.format(self.port, request.url)
+        response = super().send(request, **kwargs)
+        with self.lock:
+            self.requests += 1
+            self.bytes += len(response.content)
+        return response
+
+def install(session, port):
+    """
+    Routes every request made through `session` to the local server at `port`, keeping the pooling and retry settings of the adapter it replaces.
+
+    Returns: the adapter, whose `requests` and `bytes` attributes count the requests sent and the bytes received
+    """
+    current = session.get_adapter('https://')
+    adapter = _LocalAdapter(port, pool_connections=current._pool_connections, pool_maxsize=current._pool_maxsize, max_retries=current.max_retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
@@ -0,0 +1,228 @@
+"""
+Offline stand-ins for the government news websites crawled by `source_scraping.py`.
+
+Every loader gets listing pages and article pages with the same structure as the live website it targets, padded with
+navigation, scripts and footers so that pages have a realistic weight. Pages are generated deterministically, so that
+benchmark results can be compared between runs.
+"""
+
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, parse_qs
+import random
+
+# Articles are published once a day, starting from `last_date` and going back `n_articles` days
+last_date = datetime(2020, 9, 30, 10, 0)
+n_articles = 60
+
+# Loaders are run from `crawl_start` to `crawl_end`, which covers every article
+crawl_start = datetime(2020, 7, 1)
+crawl_end = datetime(2020, 10, 1)
+
+_words = ('health minister province public announced support funding community covid pandemic measures order '
+          'restrictions businesses schools families government services program residents care emergency new').split()
+
+def _text(seed, n_words):
+    """
+    Returns: `n_words` pseudo-random words, the same for a given `seed`
+    """
+    rand = random.Random(seed)
+    return ' '.join(rand.choice(_words) for _ in range(n_words))
+
+def _page(content, seed=0):
+    """
+    Returns: an HTML page containing `content`, surrounded by the kind of boilerplate that government websites carry
+    """
+    nav = ''.join('<li class="menu-item"><a href="/section/{0}">{1}</a></li>'.format(i, _text(seed + i, 3)) for i in range(120))
+    scripts = ''.join('<script type="text/javascript">var config{0} = {{"key": "{1}"}};</script>'.format(i, _text(seed + i, 20)) for i in range(20))
+    footer = ''.join('<p class="footer-note">{}</p>'.format(_text(seed + i, 25)) for i in range(30))
+    return ('<!DOCTYPE html><html lang="en"><head><title>News</title>' + scripts + '</head><body>'
+            '<header><nav><ul class="menu">' + nav + '</ul></nav></header>' + content +
+            '<footer>' + footer + '</footer></body></html>')
+
+def _body(i):
+    """
+    Returns: the paragraphs making up the full text of article `i`
+    """
+    return ''.join('<p>{}</p>'.format(_text(1000 * i + j, 80)) for j in range(8))
+
+def articles():
+    """
+    Returns: a list of (index, date, title) tuples for every article, from the most recent to the least recent
+    """
+    return [(i, last_date - timedelta(days=i), 'Release {}: {}'.format(i, _text(i, 6))) for i in range(n_articles)]
+
+def _paginate(page, per_page):
+    """
+    Returns: the articles listed on the given page, where the first page is `0`
+    """
+    return articles()[page * per_page:(page + 1) * per_page]
+
+# Listing and article pages for each loader. Listing functions take the parsed query string of the listing URL.
+
+def _ontario_listing(query):
+    listed = _paginate(int(query['page'][0]) - 1, 10)
+    return _page(''.join('<article class="card"><h3><a href="https://news.ontario.ca/en/release/{}">{}</a></h3><time>{}</time></article>'.format(
+        i, title, date.strftime('%B %d, %Y %I:%M %p').replace('AM', 'a.m.').replace('PM', 'p.m.')) for i, date, title in listed))
+
+def _ontario_article(i):
+    return _page('<main><article><h1>Release {}</h1>{}</article></main>'.format(i, _body(i)), i)
+
+def _manitoba_listing(query):
+    month, year = int(query['month'][0]), int(query['year'][0])
+    listed = [(i, date, title) for i, date, title in articles() if (date.month, date.year) == (month, year)]
+    return _page('<div class="maincontent">' + ''.join('<h2><a href="../news/index.html?item={}">{}</a></h2><p>{}</p>'.format(i, title, _text(i, 20)) for i, date, title in listed) + '</div>')
+
+def _manitoba_article(i):
+    date = articles()[i][1]
+    return _page('<div class="article"><span class="article_date">{}</span></div><div class="">{}</div>'.format(date.strftime('%B %d, %Y'), _body(i)), i)
+
+def _british_columbia_listing(query):
+    listed = _paginate(int(query['Page'][0]) - 1, 10)
+    return _page(''.join('<div class="article"><a href="https://news.gov.bc.ca/releases/{}">{}</a><div class="item-date">{}</div></div>'.format(
+        i, title, date.strftime('%A, %B %d, %Y %I:%M %p')) for i, date, title in listed))
+
+def _british_columbia_article(i):
+    return _page('<article><h1>Release {}</h1>{}</article>'.format(i, _body(i)), i)
+
+def _new_brunswick_listing(query):
+    listed = _paginate(int(query['mainContent_par_newslist_start'][0]) // 25, 25)
+    items = ''.join('<li><span class="post_date">{}</span><a href="content/gnb/en/news/news_release.{}.html">{}</a></li>'.format(
+        date.strftime('%d %B %Y'), i, title) for i, date, title in listed)
+    return _page('<div class="none padded"><ul>' + items + '<li><a href="#">Previous page</a></li></ul></div>')
+
+def _new_brunswick_article(i):
+    return _page('<div class="articleBody">{}</div>'.format(_body(i)), i)
+
+def _nova_scotia_listing(query):
+    listed = _paginate(int(query['page'][0]) - 1, 10)
+    return _page('<dl>' + ''.join('<dt class="RelTitle" lang="en"><a href="../release/?id={}">{}</a></dt><dd class="RelSummary"><time>{}</time> {}</dd>'.format(
+        i, title, date.strftime('%B %d, %Y - %I:%M %p'), _text(i, 20)) for i, date, title in listed) + '</dl>')
+
+def _nova_scotia_article(i):
+    return _page('<div id="releaseBody">{}</div>'.format(_body(i)), i)
+
+def _northwest_territories_listing(query):
+    listed = _paginate(int(query['page'][0]), 10)
+    return _page(''.join('<div class="views-row views-row-{}"><span>{}</span><a href="en/newsroom/release-{}">{}</a></div>'.format(
+        n, date.strftime('%B %d, %Y'), i, title) for n, (i, date, title) in enumerate(listed)))
+
+def _northwest_territories_article(i):
+    return _page('<div class="field-items"><div class="field-item even">{}</div></div>'.format(_body(i)), i)
+
+def _saskatchewan_listing(query):
+    listed = _paginate(int(query['page'][0]) - 1, 10)
+    return _page('<ul class="results">' + ''.join('<li><time datetime="{}">{}</time><a href="https://www.saskatchewan.ca/government/news-and-media/release-{}">{}</a></li>'.format(
+        date.strftime('%Y-%m-%d'), date.strftime('%B %d, %Y'), i, title) for i, date, title in listed) + '</ul>')
+
+def _saskatchewan_article(i):
+    return _page('<section class="general-content">{}</section>'.format(_body(i)), i)
+
+def _nunavut_listing(query):
+    listed = _paginate(int(query['page'][0]), 10)
+    return _page('<section id="block-system-main">' + ''.join('<div class="views-row views-row-{}"><span class="date-display-single">{}</span><a href="/news/release-{}">{}</a></div>'.format(
+        n, date.strftime('%d %B %Y'), i, title) for n, (i, date, title) in enumerate(listed)) + '</section>')
+
+def _nunavut_article(i):
+    return _page('<div class="region region-content">{}</div>'.format(_body(i)), i)
+
+def _yukon_listing(query):
+    listed = _paginate(int(query['page'][0]), 10)
+    if not listed:
+        return _page('<div class="view-empty">No results</div>')
+    return _page('<div class="view-content">' + ''.join('<div class="views-row"><small>{}</small><a href="/en/news/release-{}">{}</a></div>'.format(
+        date.strftime('%B %d, %Y'), i, title) for i, date, title in listed) + '</div>')
+
+def _yukon_article(i):
+    return _page('<div class="region region-content">{}</div>'.format(_body(i)), i)
+
+def _pei_listing(query):
+    listed = _paginate(int(query['page'][0]), 10)
+    return _page(''.join('<div class="right content views-fieldset"><div class="date">{}</div><a href="/en/news/release-{}">{}</a></div>'.format(
+        date.strftime('%A, %B %d, %Y'), i, title) for i, date, title in listed))
+
+def _pei_article(i):
+    return _page('<div class="maincontentmain">{}</div>'.format(_body(i)), i)
+
+def _alberta_listing(query):
+    items = ''.join('<item><title>{}</title><link>https://www.alberta.ca/release.cfm?xID={}</link><pubDate>{}</pubDate></item>'.format(
+        title, i, date.strftime('%a, %d %b %Y %H:%M:%S -0600')) for i, date, title in articles())
+    return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Alberta News</title><link>https://www.alberta.ca/news.aspx</link>'
+            '<image><title>Alberta</title><link>https://www.alberta.ca</link></image>' + items + '</channel></rss>')
+
+def _alberta_article(i):
+    return _page('<main><div class="goa-grid-100-100-100">{}</div></main>'.format(_body(i)), i)
+
+def _quebec_listing(query):
+    page = int(query['Page'][0]) - 1
+    listed = _paginate(page, 10)
+    sections = ''.join('<section id="articles"><time datetime="{}">{}</time><a href="http://www.fil-information.gouv.qc.ca/Pages/Article.aspx?idArticle={}">{}</a></section>'.format(
+        date.strftime('%Y-%m-%d'), date.strftime('%B %d, %Y'), i, title) for i, date, title in listed)
+    last = '<ul class="pager"><li class="last"><a href="#">Last</a></li></ul>' if _paginate(page + 1, 10) else ''
+    return _page(sections + last)
+
+def _quebec_article(i):
+    return _page('<div class="article">{}</div>'.format(_body(i)), i)
+
+def _newfoundland_listing(query):
+    year = int(query['ny'][0])
+    days = {}
+    for i, date, title in articles():
+        if date.year == year:
+            days.setdefault(date.strftime('%B %d'), []).append((i, title))
+    content = ''.join('<h2>{}</h2><ul>{}</ul>'.format(day, ''.join('<li><a href="https://www.gov.nl.ca/releases/{}/release-{}/">{}</a></li>'.format(year, i, title) for i, title in listed)) for day, listed in days.items())
+    return _page('<div class="news-results">' + content + '</div>')
+
+def _newfoundland_article(i):
+    return _page('<div class="entry-content">{}</div>'.format(_body(i)), i)
+
+# (host, test on the path and query identifying a listing page, listing function, article function)
+_routes = {
+    'ontario' : ('news.ontario.ca', lambda path, query: path.endswith('/search'), _ontario_listing, _ontario_article),
+    'manitoba' : ('news.gov.mb.ca', lambda path, query: 'month' in query, _manitoba_listing, _manitoba_article),
+    'british columbia' : ('news.gov.bc.ca', lambda path, query: path == '/Search', _british_columbia_listing, _british_columbia_article),
+    'new brunswick' : ('www2.gnb.ca', lambda path, query: path.endswith('recent_news.html'), _new_brunswick_listing, _new_brunswick_article),
+    'nova scotia' : ('novascotia.ca', lambda path, query: path.startswith('/news/search'), _nova_scotia_listing, _nova_scotia_article),
+    'northwest territories' : ('www.gov.nt.ca', lambda path, query: 'page' in query, _northwest_territories_listing, _northwest_territories_article),
+    'saskatchewan' : ('www.saskatchewan.ca', lambda path, query: 'page' in query, _saskatchewan_listing, _saskatchewan_article),
+    'nunavut' : ('gov.nu.ca', lambda path, query: 'page' in query, _nunavut_listing, _nunavut_article),
+    'yukon' : ('yukon.ca', lambda path, query: 'page' in query, _yukon_listing, _yukon_article),
+    'pei' : ('www.princeedwardisland.ca', lambda path, query: 'page' in query, _pei_listing, _pei_article),
+    'alberta' : ('www.alberta.ca', lambda path, query: 'numDaysBack' in query, _alberta_listing, _alberta_article),
+    'quebec' : ('www.fil-information.gouv.qc.ca', lambda path, query: path.endswith('Articles.aspx'), _quebec_listing, _quebec_article),
+    'newfoundland' : ('www.gov.nl.ca', lambda path, query: 'ny' in query, _newfoundland_listing, _newfoundland_article),
+}
+
+provinces = list(_routes)
+
+def _article_index(url):
+    """
+    Returns: the index of the article linked to by `url`, which is always the last number in the URL
+    """
+    digits = ''.join(c if c.isdigit() else ' ' for c in url).split()
+    return int(digits[-1])
+
+def page(url):
+    """
+    Parameters:
+        - `url`
+            string, a URL requested by one of the loaders
+
+    Returns: a tuple containing the status code, the content type, the kind of page ('listing' or 'article') and the body of the page as bytes. Unknown URLs are answered with a 404.
+    """
+    parts = urlsplit(url)
+    query = parse_qs(parts.query, keep_blank_values=True)
+
+    for host, is_listing, listing, article in _routes.values():
+        if parts.hostname != host:
+            continue
+
+        if is_listing(parts.path, query):
+            content_type = 'application/rss+xml; charset=utf-8' if host == 'www.alberta.ca' else 'text/html; charset=utf-8'
+            return 200, content_type, 'listing', listing(query).encode('utf-8')
+
+        i = _article_index(url)
+        if i >= n_articles:
+            break
+        return 200, 'text/html; charset=utf-8', 'article', article(i).encode('utf-8')
+
+    return 404, 'text/html; charset=utf-8', 'article', b'<html><body>Not found</body></html>'
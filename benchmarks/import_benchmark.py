@@ -0,0 +1,57 @@
+"""
+Measures how long it takes a fresh Python process to import each module of the repository, which is the fixed cost
+paid by every run of `run-classifier.py` before any work starts. Each import runs in its own interpreter with
+`-X importtime`, so that nothing is already cached in `sys.modules`. Run from the root of the repository:
+
+    python benchmarks/import_benchmark.py [--modules source_scraping topic_modelling] [--repeat 5] [--top 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _import_once(module):
+    """
+    Returns: a tuple containing the wall time taken by a new interpreter to import `module`, and a dictionary mapping each package imported directly by `module` to its cumulative import time, both in seconds
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module], cwd=_root, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError('Could not import {}:\n{}'.format(module, result.stderr.strip().splitlines()[-1]))
+
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name.startswith('   ') and not name.startswith('    '): # Nested once, so imported directly by `module`
+            packages[name.strip()] = int(cumulative) / 1e6
+
+    return elapsed, packages
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='+', default=['source_scraping', 'topic_modelling'], help='modules to import')
+    parser.add_argument('--repeat', type=int, default=5, help='number of measured imports per module; the median is reported')
+    parser.add_argument('--top', type=int, default=8, help='number of slowest packages listed for each module')
+    args = parser.parse_args()
+
+    print('{:<24}{:>14}{:>14}'.format('module', 'median s', 'min s'))
+    for module in args.modules:
+        _import_once(module) # Warm up the file system cache, so that only the import itself is measured
+        runs = [_import_once(module) for _ in range(args.repeat)]
+        times = [elapsed for elapsed, _ in runs]
+        print('{:<24}{:>14.3f}{:>14.3f}'.format(module, statistics.median(times), min(times)))
+
+        packages = runs[times.index(min(times))][1]
+        for name, seconds in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+            print('    {:<36}{:>10.3f}'.format(name, seconds))
+
+if __name__ == '__main__':
+    main()
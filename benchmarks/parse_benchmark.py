@@ -0,0 +1,81 @@
+"""
+Measures the CPU time each loader in `source_scraping.py` spends per page, for each available HTML parser backend.
+
+Pages come from `fixtures.py` and are served from memory, so no network access is needed and nearly all of the time
+measured is spent parsing. Run from the root of the repository:
+
+    python benchmarks/parse_benchmark.py [--parsers lxml html.parser] [--provinces ontario yukon] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import fixtures
+import source_scraping
+
+_pages = {} # Generated pages, kept so that generating them is not measured
+_requests = [0]
+
+def _serve(url, headers=None, timeout=None, **kwargs):
+    """
+    Stands in for `source_scraping._session.get`, answering with the fixture page for `url`
+    """
+    if url not in _pages:
+        _pages[url] = fixtures.page(url)
+    status, content_type, kind, body = _pages[url]
+    _requests[0] += 1
+
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response.headers = CaseInsensitiveDict({'Content-Type' : content_type})
+    response.encoding = 'utf-8'
+    response._content = body
+    return response
+
+def _run(province):
+    """
+    Returns: a tuple containing the number of pages requested, the number of rows returned and the CPU time taken to load the fixture articles of `province`
+    """
+    _requests[0] = 0
+    start = time.process_time()
+    df = source_scraping._load_province(province, start_date=fixtures.crawl_start, end_date=fixtures.crawl_end, verbose=False, max_workers=1)
+    return _requests[0], len(df.index), time.process_time() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--parsers', nargs='+', default=['lxml', 'html.parser'], help='parser backends to compare')
+    parser.add_argument('--provinces', nargs='+', default=fixtures.provinces, help='loaders to measure')
+    parser.add_argument('--repeat', type=int, default=3, help='number of measured runs per loader; the fastest is reported')
+    args = parser.parse_args()
+
+    source_scraping._session.get = _serve
+    if hasattr(source_scraping, 'configure_cache'):
+        source_scraping.configure_cache(enabled=False)
+    if hasattr(source_scraping, 'configure_rate_limit'): # Pages are served from memory, so there is no host to be polite to
+        source_scraping.configure_rate_limit(rate=1e9, burst=1e9)
+    os.chdir(tempfile.mkdtemp()) # Journals are written to a scratch directory
+
+    # Versions of `source_scraping` without a pluggable parser only have their built-in one
+    parsers = args.parsers if hasattr(source_scraping, 'configure_parser') else ['built-in']
+
+    print('{:<24}{:<14}{:>8}{:>8}{:>16}'.format('loader', 'parser', 'pages', 'rows', 'CPU ms/page'))
+    for province in args.provinces:
+        for parser_name in parsers:
+            if parser_name != 'built-in':
+                source_scraping.configure_parser(parser_name)
+
+            _run(province) # Warm up and generate the pages
+            pages, rows, cpu = min((_run(province) for _ in range(args.repeat)), key=lambda result: result[2])
+            print('{:<24}{:<14}{:>8}{:>8}{:>16.2f}'.format(province, parser_name, pages, rows, 1000 * cpu / max(pages, 1)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Compares the streaming preprocessing pipeline of `topic_modelling.py` with the implementation it replaced, which
+built a full list of documents after each step and looked stop words up in a list. Both run on the articles saved in
+`sources/`, with the on-disk cache of lemmatized documents turned off. Run from the root of the repository:
+
+    python benchmarks/preprocess_benchmark.py [--articles 2000] [--batch-size 64] [--repeat 3]
+
+Reports the wall time and peak memory allocated by each implementation, and checks that their output is the same.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _root)
+
+import pandas as pd
+
+import topic_modelling
+
+def _list_preprocess(texts, stop_words, allowed_postags, batch_size):
+    """
+    Returns: the preprocessed documents, built one full list per step as `custom_preprocess` used to
+    """
+    words = list(topic_modelling.texts_to_words(texts))
+    cleaned_words = topic_modelling.clean(words)
+    bigrams = topic_modelling.make_bigrams(cleaned_words)
+    lemmatized = topic_modelling.lemmatize(bigrams, allowed_postags=allowed_postags, batch_size=batch_size)
+    return [[word for word in doc if word not in stop_words] for doc in lemmatized]
+
+def _streaming_preprocess(texts, stop_words, allowed_postags, batch_size):
+    """
+    Returns: the preprocessed documents, built by the current `custom_preprocess`
+    """
+    return topic_modelling.custom_preprocess(texts, stop_words, allowed_postags, batch_size=batch_size)
+
+def _measure(preprocess, texts, stop_words, allowed_postags, batch_size, repeat):
+    """
+    Returns: a tuple containing the output of `preprocess`, its fastest wall time in seconds, and the peak memory it allocated in bytes
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = preprocess(texts, stop_words, allowed_postags, batch_size)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    preprocess(texts, stop_words, allowed_postags, batch_size)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return output, min(times), peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--articles', type=int, default=2000, help='number of articles preprocessed')
+    parser.add_argument('--batch-size', type=int, default=64, help='number of documents lemmatized together')
+    parser.add_argument('--repeat', type=int, default=3, help='number of timed runs of each implementation; the fastest is reported')
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(_root, 'sources', '*.csv')))
+    texts = pd.concat([pd.read_csv(path, usecols=['source_full_text']) for path in paths])['source_full_text'].dropna()
+    texts = texts.tolist()[:args.articles]
+
+    stop_words = topic_modelling.stopwords.words('english') # A list, as passed by run-classifier.py
+    allowed_postags = ['NOUN', 'ADJ', 'VERB']
+    topic_modelling.spacy_pipeline() # Loaded before measuring, as it is only loaded once per process
+    topic_modelling.configure_preprocess_cache(enabled=False)
+
+    print('{} articles, {} words'.format(len(texts), sum(len(text.split()) for text in texts)))
+    print('{:<16}{:>12}{:>12}{:>14}'.format('pipeline', 'seconds', 'docs/s', 'peak MB'))
+    outputs = []
+    for name, preprocess in [('lists', _list_preprocess), ('streaming', _streaming_preprocess)]:
+        output, seconds, peak = _measure(preprocess, texts, stop_words, allowed_postags, args.batch_size, args.repeat)
+        outputs.append(output)
+        print('{:<16}{:>12.2f}{:>12.1f}{:>14.1f}'.format(name, seconds, len(texts) / seconds, peak / 1e6))
+
+    print('Same output: {}'.format(outputs[0] == outputs[1]))
+
+if __name__ == '__main__':
+    main()
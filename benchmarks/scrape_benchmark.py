@@ -0,0 +1,85 @@
+"""
+Measures the throughput of each loader in `source_scraping.py` against a local stand-in for the website it crawls,
+without any network access. Pages come from `fixtures.py` and are served over HTTP by `fixture_server.py`, with
+configurable latency and error rates. Run from the root of the repository:
+
+    python benchmarks/scrape_benchmark.py [--provinces ontario yukon] [--latency 0.05] [--error-rate 0.02] [--max-workers 8]
+
+For each loader, reports the articles retrieved per second, the requests sent per article, the CPU time spent parsing
+pages, as recorded in the crawl report of `source_scraping.py`, and the peak memory the loader allocated.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fixtures
+import fixture_server
+import source_scraping
+
+def _run(province, max_workers, adapter, trace_memory=False):
+    """
+    Returns: a dictionary of measurements taken while loading the fixture articles of `province`
+    """
+    requests_before, bytes_before = adapter.requests, adapter.bytes
+    source_scraping.reset_crawl_metrics()
+    if trace_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    df = source_scraping._load_province(province, start_date=fixtures.crawl_start, end_date=fixtures.crawl_end, verbose=False, max_workers=max_workers)
+    elapsed = time.perf_counter() - start
+    parse_seconds = source_scraping.crawl_report()['provinces'][province.lower()]['parse_seconds'] # Summed over the threads fetching articles
+
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {'articles' : len(df.index), 'requests' : adapter.requests - requests_before, 'bytes' : adapter.bytes - bytes_before,
+            'seconds' : elapsed, 'parse_seconds' : parse_seconds, 'peak' : peak}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--provinces', nargs='+', default=fixtures.provinces, help='loaders to measure')
+    parser.add_argument('--max-workers', type=int, default=source_scraping._max_workers, help='article pages each loader requests at once')
+    parser.add_argument('--latency', type=float, default=0.02, help='seconds the server waits before answering each request')
+    parser.add_argument('--jitter', type=float, default=0.01, help='largest number of seconds added at random to the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with a 503')
+    parser.add_argument('--retry-after', type=int, default=None, help='seconds sent in the Retry-After header of 503 responses')
+    parser.add_argument('--rate', type=float, default=None, help='requests per second allowed to each host; unlimited by default')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the injected latencies and errors')
+    parser.add_argument('--no-memory', action='store_true', help='skip the separate run that measures peak memory, which is slowed down by tracing')
+    args = parser.parse_args()
+
+    server, port = fixture_server.start(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, retry_after=args.retry_after, seed=args.seed)
+    adapter = fixture_server.install(source_scraping._session, port)
+
+    source_scraping.configure_cache(enabled=False)
+    if args.rate is None:
+        source_scraping.configure_rate_limit(rate=1e9, burst=1e9)
+    else:
+        source_scraping.configure_rate_limit(rate=args.rate)
+    os.chdir(tempfile.mkdtemp()) # Journals are written to a scratch directory
+
+    print('{:<24}{:>10}{:>12}{:>14}{:>12}{:>18}{:>12}'.format('loader', 'articles', 'articles/s', 'req/article', 'MB down', 'parse ms/article', 'peak MB'))
+    try:
+        for province in args.provinces:
+            result = _run(province, args.max_workers, adapter)
+            if not args.no_memory:
+                result['peak'] = _run(province, args.max_workers, adapter, trace_memory=True)['peak']
+
+            articles = max(result['articles'], 1)
+            print('{:<24}{:>10}{:>12.1f}{:>14.2f}{:>12.2f}{:>18.2f}{:>12}'.format(
+                province, result['articles'], result['articles'] / result['seconds'], result['requests'] / articles,
+                result['bytes'] / 1e6, 1000 * result['parse_seconds'] / articles, '-' if result['peak'] is None else '{:.1f}'.format(result['peak'] / 1e6)))
+    finally:
+        server.terminate()
+
+if __name__ == '__main__':
+    main()
@@ -1,69 +1,58 @@
-from source_scraping import load_all, load_province
+from source_scraping import load_all, load_province, content_hash, append_csv, write_crawl_report
 from topic_modelling import *
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.metrics import accuracy_score, precision_score, recall_score
-from sklearn.linear_model import SGDClassifier, SGDRegressor, LogisticRegression
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
-from sklearn.multiclass import OneVsRestClassifier, OneVsOneClassifier
-from sklearn.metrics import confusion_matrix
-from sklearn.metrics import roc_auc_score
-from sklearn.utils import shuffle
-from sklearn.svm import LinearSVC, SVC, SVR, LinearSVR
-
-from xgboost import XGBClassifier, XGBRegressor
-from matplotlib import pyplot as plt
-
+# The classifiers are unpickled by joblib, which imports the modules they need (e.g. sklearn). TensorFlow is only imported once there are new articles to classify.
 import numpy as np
 import pandas as pd
 
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Dense, Dropout, Input, Activation, ActivityRegularization
-from tensorflow.keras.optimizers import SGD, Nadam, Adam, Adamax
-from tensorflow.keras.regularizers import l1, l2, l1_l2
-from tensorflow.keras.metrics import Precision, Recall, BinaryAccuracy, AUC
-
 import os
+import sys
 import joblib
+from warnings import warn
 
-df = load_all(update_csv=True)
+df = load_all(update_csv=True, parallel=True)
+write_crawl_report('crawl_report.json', prometheus_path='crawl_metrics.prom')
 df = df[df['region'] != 'Quebec']
 
+csv_path = 'predictions.csv'
+hashes_path = 'predictions.hashes.txt' # Content hashes of the articles in `csv_path`, one per line
+
+try:
+    with open(hashes_path, encoding='utf-8') as f:
+        known_hashes = set(line.strip() for line in f if line.strip())
+    new_hashes = []
+except OSError: # Built from the predictions the first time it is needed
+    try: 
+        known_hashes = set(pd.read_csv(csv_path, usecols=['source_full_text'])['source_full_text'].map(content_hash).dropna())
+    except:
+        known_hashes = set()
+    new_hashes = list(known_hashes)
+
+# Only articles that have not been classified yet are classified, keeping the predicted instance of each text
+preds = df[~df['content_hash'].isin(known_hashes)].drop_duplicates(['content_hash']).copy()
+if preds.empty:
+    print('No new articles to classify')
+    sys.exit()
+
+from tensorflow import keras
+
 bin_clf = joblib.load('models/binary_rnd_clf')
 ann = keras.models.load_model('models/multilabel_ann')
 lda_model = LdaModel.load('models/lda')
+phraser = load_phraser('models/lda') # The bigrams the model was trained with
+if phraser is None:
+    warn('No phraser saved with models/lda, bigrams are learned from the new articles instead')
 
 lda_info = {
     'best_model' : lda_model,
-    'id2word' : lda_model.id2word
+    'id2word' : lda_model.id2word,
+    'phraser' : phraser
 }
 
-import pandas as pd
-
-csv_path = 'predictions.csv'
-
-try: 
-    preds = pd.read_csv(csv_path)
-    preds = df.append(preds) # Newest articles first
-    preds = preds.drop_duplicates(['source_full_text'], keep='last') # Will keep predicted instance of text
-except:
-    preds = df
-
-def lda_preprocess(texts, lda_model, lda_dict, stop_words=stopwords.words('english'), allowed_postags=['NOUN', 'ADJ', 'VERB']):
-    partially_processed = custom_preprocess(texts, stop_words=stop_words, allowed_postags=allowed_postags)
+def lda_preprocess(texts, lda_model, lda_dict, stop_words=stopwords.words('english'), allowed_postags=['NOUN', 'ADJ', 'VERB'], phraser=None):
+    partially_processed = custom_preprocess(texts, stop_words=stop_words, allowed_postags=allowed_postags, phraser=phraser)
     corpus = form_corpus(partially_processed, lda_dict)
-    texts_by_topic = [lda_model.get_document_topics(doc) for doc in corpus]
-    processed_texts = []
-    for topic_list in texts_by_topic:
-        feature_list = np.zeros(len(lda_model.get_topics()))
-        for index, value in topic_list:
-            feature_list[index] = value
-        processed_texts.append(feature_list)
-    return np.array(processed_texts)
+    return document_topics(lda_model, corpus)
 
 def geo_stop_words(df):
     flatten = lambda l: [item for sublist in l for item in sublist] # flatten code from stackoverflow...
@@ -73,11 +62,11 @@ def geo_stop_words(df):
     return geo_stop_words
 
 stopwords = stopwords.words('english')
-stopwords.extend(geo_stop_words(preds))
+stopwords.extend(geo_stop_words(df))
 stopwords.append('Some parts of this page will not display.JavaScript is not available in this browser or may be turned off.')
 
 texts = np.array(preds['source_full_text'])
-x = lda_preprocess(texts, lda_model, lda_model.id2word, stop_words=stopwords)
+x = lda_preprocess(texts, lda_model, lda_model.id2word, stop_words=stopwords, phraser=phraser)
 
 intervention_confidences = bin_clf.predict_proba(x)[:, 1]
 multilabel_predictions = ann.predict(x)
@@ -124,4 +113,8 @@ preds['health_confidence'] = h_confidences
 preds['containment_confidence'] = c_confidences
 preds['economic_confidence'] = e_confidences
 
-preds.to_csv(csv_path)
\ No newline at end of file
+new_hashes.extend(preds['content_hash'])
+append_csv(csv_path, preds) # Only the new predictions are written
+
+with open(hashes_path, 'a', encoding='utf-8') as f:
+    f.write(''.join(h + '\n' for h in new_hashes))
\ No newline at end of file
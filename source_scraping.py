@@ -1,20 +1,619 @@
 import requests
 import urllib.request
-import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 import feedparser
 from datetime import date
 from datetime import datetime
+from datetime import timedelta
 import re
+import os
+import json
+import time
+import hashlib
+import threading
+import queue
+import contextvars
+import math
 from warnings import warn
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
 
 _country = 'Canada'
 _src_cat = 'Government Website'
-_columns = ['start_date', 'country', 'region', 'subregion', 'source_url', 'source_category', 'source_title', 'source_full_text']
+_columns = ['start_date', 'country', 'region', 'subregion', 'source_url', 'source_category', 'source_title', 'source_full_text', 'content_hash']
+_max_workers = 8 # Default number of article pages each loader requests at once
+_csv_chunksize = 1000 # Number of CSV rows read at once when streaming saved articles
+_queue_size = 1000 # Number of rows retrieved in parallel that may wait to be consumed
+_csv_order = ['start_date', 'source_url'] # Order of the rows added to CSVs, so that files only change by the rows appended to them
+_provinces = ['alberta', 'british columbia', 'manitoba', 'new brunswick', 'newfoundland', 'northwest territories', 'nova scotia', 'nunavut', 'ontario', 'pei', 'quebec', 'saskatchewan', 'yukon']
+
+# HTTP client shared by every loader
+_timeout = 30 # Seconds to wait for a server to connect or send data
+_retries = 5 # Number of times a request is retried after a connection error or a 5xx response
+_backoff_factor = 0.5 # Retries wait 0.5s, 1s, 2s, 4s, ... between attempts
+_retry_statuses = [500, 502, 504]
+_throttle_statuses = [429, 503] # Handled by the scheduler, which slows down the whole host instead of retrying a single request
+
+def _make_session(pool_size=2 * _max_workers, retries=_retries, backoff_factor=_backoff_factor):
+    """
+    Parameters:
+        - `pool_size`
+            int, the maximum number of keep-alive connections kept open to each host
+        - `retries`
+            int, the number of times a request is retried after a connection error or a transient server error
+        - `backoff_factor`
+            float, the base of the exponential wait between retries, in seconds
+
+    Returns: a `requests.Session` that pools connections per host and retries transient failures with exponential backoff
+    """
+    retry = Retry(total=retries, connect=retries, read=retries, status=retries, backoff_factor=backoff_factor, status_forcelist=_retry_statuses,
+                  respect_retry_after_header=False) # 429 and 503 responses are left to the scheduler, which slows down the whole host
+    adapter = HTTPAdapter(pool_connections=2 * len(_provinces), pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+_session = _make_session()
+
+# Crawl telemetry, recorded for the province whose articles are being loaded
+_current_province = contextvars.ContextVar('province', default=None)
+_latency_buckets = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10] # Upper bounds, in seconds, of the latency histogram in Prometheus reports
+
+class _CrawlMetrics:
+    """
+    Collects measurements about the crawl of each province. Can be updated from several threads at once.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = datetime.now()
+        self.provinces = {}
+
+    def add(self, province=None, **values):
+        """
+        Adds each of the given values to the measurement of the same name for `province`, or for the province currently being loaded if None. The `latency` value is recorded as one more request latency.
+        """
+        province = province or _current_province.get() or 'other'
+        with self.lock:
+            if province not in self.provinces:
+                self.provinces[province] = {'requests' : 0, 'cache_hits' : 0, 'request_errors' : 0, 'bytes' : 0, 'latencies' : [], 'parse_seconds' : 0.0,
+                                            'search_seconds' : 0.0, 'articles_new' : 0, 'articles_skipped' : 0, 'articles_failed' : 0, 'failures' : 0}
+            measurements = self.provinces[province]
+            for name, value in values.items():
+                if name == 'latency':
+                    measurements['latencies'].append(value)
+                else:
+                    measurements[name] += value
+
+_metrics = _CrawlMetrics()
+
+def _percentile(values, q):
+    """
+    Returns: the `q`-th percentile of the sorted list `values`, by the nearest-rank method, or None if it is empty
+    """
+    if not values:
+        return None
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+def crawl_report():
+    """
+    Returns: a dictionary describing the crawl since the module was imported or `reset_crawl_metrics` was last called. For each province, it contains the number of requests sent, the pages read from the cache, the requests that failed, the bytes downloaded, the request latency percentiles, the CPU time spent parsing pages, the time spent searching, the articles that were new, skipped because they were already known, or could not be parsed, and the searches that failed.
+    """
+    with _metrics.lock:
+        provinces = {}
+        for province, measurements in sorted(_metrics.provinces.items()):
+            latencies = sorted(measurements['latencies'])
+            report = {name : value for name, value in measurements.items() if name != 'latencies'}
+            report['latency_seconds'] = {'p50' : _percentile(latencies, 50), 'p90' : _percentile(latencies, 90), 'p99' : _percentile(latencies, 99), 'max' : latencies[-1] if latencies else None}
+            provinces[province] = report
+
+    totals = {name : sum(report[name] for report in provinces.values()) for name in ['requests', 'cache_hits', 'request_errors', 'bytes', 'parse_seconds', 'search_seconds', 'articles_new', 'articles_skipped', 'articles_failed', 'failures']}
+    return {'started' : _metrics.started.isoformat(), 'finished' : datetime.now().isoformat(), 'totals' : totals, 'provinces' : provinces}
+
+def _prometheus_text():
+    """
+    Returns: the measurements of the crawl in the Prometheus text exposition format
+    """
+    with _metrics.lock:
+        provinces = {province : dict(measurements, latencies=list(measurements['latencies'])) for province, measurements in sorted(_metrics.provinces.items())}
+
+    counters = [('requests', 'scraper_requests_total', 'Requests sent to government websites'),
+                ('cache_hits', 'scraper_cache_hits_total', 'Pages read from the response cache'),
+                ('request_errors', 'scraper_request_errors_total', 'Requests that raised an error or received an error status'),
+                ('bytes', 'scraper_downloaded_bytes_total', 'Bytes of page content downloaded'),
+                ('parse_seconds', 'scraper_parse_seconds_total', 'CPU seconds spent parsing pages'),
+                ('search_seconds', 'scraper_search_seconds_total', 'Seconds spent searching for articles'),
+                ('failures', 'scraper_search_failures_total', 'Searches that failed')]
+
+    lines = []
+    for name, metric, description in counters:
+        lines += ['# HELP {} {}'.format(metric, description), '# TYPE {} counter'.format(metric)]
+        lines += ['{}{{province="{}"}} {}'.format(metric, province, measurements[name]) for province, measurements in provinces.items()]
+
+    lines += ['# HELP scraper_articles_total Articles found, by whether they were new, skipped or failed to parse', '# TYPE scraper_articles_total counter']
+    for province, measurements in provinces.items():
+        lines += ['scraper_articles_total{{province="{}",status="{}"}} {}'.format(province, status, measurements['articles_' + status]) for status in ['new', 'skipped', 'failed']]
+
+    lines += ['# HELP scraper_request_latency_seconds Latency of requests to government websites', '# TYPE scraper_request_latency_seconds histogram']
+    for province, measurements in provinces.items():
+        latencies = measurements['latencies']
+        for bound in _latency_buckets:
+            lines.append('scraper_request_latency_seconds_bucket{{province="{}",le="{}"}} {}'.format(province, bound, sum(1 for latency in latencies if latency <= bound)))
+        lines.append('scraper_request_latency_seconds_bucket{{province="{}",le="+Inf"}} {}'.format(province, len(latencies)))
+        lines.append('scraper_request_latency_seconds_sum{{province="{}"}} {}'.format(province, sum(latencies)))
+        lines.append('scraper_request_latency_seconds_count{{province="{}"}} {}'.format(province, len(latencies)))
+
+    return '\n'.join(lines) + '\n'
+
+def write_crawl_report(path='crawl_report.json', prometheus_path=None):
+    """
+    Parameters:
+        - `path`
+            string, the path of the JSON file to which the report of `crawl_report` is written
+        - `prometheus_path`
+            string, the path of a file to which the same measurements are written in the Prometheus text format, e.g. for the node exporter's textfile collector. By default, this is set to None, which writes no such file.
+    """
+    _write_atomic(path, json.dumps(crawl_report(), indent=2).encode('utf-8'))
+    if prometheus_path is not None:
+        _write_atomic(prometheus_path, _prometheus_text().encode('utf-8'))
+
+def reset_crawl_metrics():
+    """
+    Discards every measurement recorded so far, so that the next report only describes the crawl that follows
+    """
+    global _metrics
+    _metrics = _CrawlMetrics()
+
+# Per-host request scheduling, shared by every loader
+_host_rate = 5.0 # Average number of requests per second sent to a single host
+_host_burst = 10 # Number of requests that may be sent to a host at once after it has been idle
+_host_max_concurrency = 2 * _max_workers # Upper bound of the adaptive number of requests in flight to a single host
+_max_connections = 64 # Number of requests in flight across all hosts
+
+class _HostScheduler:
+    """
+    Decides when each request may be sent, so that crawling stays polite to every host:
+        - each host has a token bucket allowing `rate` requests per second, with bursts of up to `burst` requests
+        - each host has a concurrency limit that grows while its responses stay fast, and shrinks when they slow down or when the host answers 429 or 503
+        - a host that sends a `Retry-After` header receives no requests until that time has passed
+        - at most `max_total` requests are in flight across all hosts, and free slots go to the ready host that was served least recently, so that hosts are interleaved fairly
+    """
+
+    def __init__(self, rate=_host_rate, burst=_host_burst, max_concurrency=_host_max_concurrency, max_total=_max_connections):
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.max_total = max_total
+        self.total = 0
+        self.hosts = {}
+        self.condition = threading.Condition()
+
+    def _host(self, host):
+        if host not in self.hosts:
+            self.hosts[host] = {'tokens' : float(self.burst), 'refilled' : time.monotonic(), 'limit' : float(min(_max_workers, self.max_concurrency)), 'in_flight' : 0,
+                                'waiting' : 0, 'blocked_until' : 0.0, 'served' : 0.0, 'throttled' : 0, 'latency' : None, 'min_latency' : None}
+        return self.hosts[host]
+
+    def _wait_time(self, state, now):
+        """
+        Returns: the number of seconds before a request may be sent to the host with the given state, 0 if one may be sent now, or None if it has to wait for another request to finish
+        """
+        state['tokens'] = min(self.burst, state['tokens'] + (now - state['refilled']) * self.rate)
+        state['refilled'] = now
+
+        if now < state['blocked_until']:
+            return state['blocked_until'] - now
+        if state['in_flight'] >= int(state['limit']) or self.total >= self.max_total:
+            return None
+        if state['tokens'] < 1:
+            return (1 - state['tokens']) / self.rate
+        return 0
+
+    def acquire(self, host):
+        """
+        Blocks until a request may be sent to `host`
+        """
+        with self.condition:
+            state = self._host(host)
+            state['waiting'] += 1
+            while True:
+                now = time.monotonic()
+                wait = self._wait_time(state, now)
+                if wait == 0:
+                    # Of the hosts ready to be served, the one served least recently goes first
+                    ready = [other for other in self.hosts.values() if other['waiting'] and self._wait_time(other, now) == 0]
+                    if min(ready, key=lambda other: other['served']) is state:
+                        break
+                self.condition.wait(timeout=wait or None)
+
+            state['waiting'] -= 1
+            state['tokens'] -= 1
+            state['in_flight'] += 1
+            state['served'] = now
+            self.total += 1
+
+    def release(self, host, latency, status=None, retry_after=None):
+        """
+        Records the outcome of a request to `host`, adapting how fast the host is crawled
+
+        Parameters:
+            - `latency`
+                float, the number of seconds the request took
+            - `status`
+                int, the status code of the response, or None if no response was received
+            - `retry_after`
+                string, the value of the response's `Retry-After` header, if any
+        """
+        with self.condition:
+            state = self._host(host)
+            state['in_flight'] -= 1
+            self.total -= 1
+
+            if status in _throttle_statuses:
+                state['throttled'] += 1
+                state['limit'] = max(1.0, state['limit'] / 2)
+                delay = _retry_after_seconds(retry_after)
+                if delay is None:
+                    delay = _backoff_factor * 2 ** (state['throttled'] - 1)
+                state['blocked_until'] = max(state['blocked_until'], time.monotonic() + delay)
+            elif status is not None:
+                state['throttled'] = 0
+                state['latency'] = latency if state['latency'] is None else 0.8 * state['latency'] + 0.2 * latency
+                state['min_latency'] = latency if state['min_latency'] is None else min(state['min_latency'], latency)
+
+                if state['latency'] > 2 * state['min_latency'] + 0.05: # The host is slowing down under the current load
+                    state['limit'] = max(1.0, state['limit'] * 0.9)
+                else:
+                    state['limit'] = min(self.max_concurrency, state['limit'] + 1 / state['limit'])
+
+            self.condition.notify_all()
+
+def _retry_after_seconds(value):
+    """
+    Returns: the number of seconds requested by a `Retry-After` header given either in seconds or as an HTTP date, or None if `value` is not a valid header
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        until = parsedate_to_datetime(value)
+        return max(0.0, (until - datetime.now(until.tzinfo)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+_scheduler = _HostScheduler()
+
+def configure_rate_limit(rate=_host_rate, burst=_host_burst, max_concurrency=_host_max_concurrency, max_total=_max_connections):
+    """
+    Parameters:
+        - `rate`
+            float, the average number of requests per second sent to a single host
+        - `burst`
+            int, the number of requests that may be sent to a host at once after it has been idle
+        - `max_concurrency`
+            int, the largest number of requests in flight to a single host. The actual limit adapts to how quickly each host responds, up to this value.
+        - `max_total`
+            int, the largest number of requests in flight across all hosts
+
+    Changes how fast every loader sends requests. Should be called before loading begins.
+    """
+    global _scheduler
+    _scheduler = _HostScheduler(rate=rate, burst=burst, max_concurrency=max_concurrency, max_total=max_total)
+
+def _request(url, headers=None, timeout=_timeout):
+    """
+    Sends a GET request for `url` through the shared session once the scheduler allows it. Responses asking the client to slow down (429 and 503) are retried up to `_retries` times, after the wait the host asked for.
+
+    Returns: the response for `url`
+    """
+    host = urlsplit(url).hostname
+    for _ in range(_retries + 1):
+        _scheduler.acquire(host)
+        start = time.monotonic()
+        response = None
+        try:
+            response = _session.get(url, headers=headers, timeout=timeout)
+        finally:
+            latency = time.monotonic() - start
+            status = response.status_code if response is not None else None
+            retry_after = response.headers.get('Retry-After') if response is not None else None
+            _scheduler.release(host, latency, status, retry_after)
+            _metrics.add(requests=1, latency=latency, bytes=len(response.content) if response is not None else 0,
+                         request_errors=1 if status is None or status >= 400 else 0)
+
+        if response.status_code not in _throttle_statuses:
+            break
+
+    return response
+
+# On-disk cache of responses, keyed by URL
+_cache_ttl = {'listing' : timedelta(hours=1), 'article' : timedelta(days=30)} # Listing pages change often, while articles rarely change once published
+_cache_settings = {'enabled' : True, 'offline' : False, 'directory' : '.http_cache', 'max_bytes' : 2**30}
+
+def configure_cache(enabled=True, offline=False, directory='.http_cache', max_bytes=2**30):
+    """
+    Parameters:
+        - `enabled`
+            boolean, whether or not responses should be saved to and read from the on-disk cache. By default, this is set to True.
+        - `offline`
+            boolean, whether or not pages should only be read from the cache, without contacting any server. Pages missing from the cache are treated as empty. By default, this is set to False.
+        - `directory`
+            string, the path of the directory in which responses are cached
+        - `max_bytes`
+            int, the size past which the responses used least recently are removed from the cache once a province has been searched. None never removes them.
+
+    Changes how every loader retrieves pages. Offline mode allows `load_province` to be run entirely from previously cached responses.
+    """
+    _cache_settings['enabled'] = enabled or offline
+    _cache_settings['offline'] = offline
+    _cache_settings['directory'] = directory
+    _cache_settings['max_bytes'] = max_bytes
+
+def _cache_paths(url):
+    """
+    Returns the metadata and body paths under which the response for `url` is cached
+    """
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    folder = os.path.join(_cache_settings['directory'], key[:2])
+    return os.path.join(folder, key + '.json'), os.path.join(folder, key + '.body')
+
+def _write_atomic(path, data):
+    """
+    Writes the bytes `data` to `path` through a temporary file, so that readers never see a partially written file
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = '{}.{}.{}.tmp'.format(path, os.getpid(), threading.get_ident())
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
 
-def _load_ontario(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _read_cache(url):
+    """
+    Returns: a tuple containing the metadata and body cached for `url`, or (None, None) if it has not been cached. Marks them as recently used.
+    """
+    meta_path, body_path = _cache_paths(url)
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        os.utime(meta_path)
+    except (OSError, ValueError):
+        return None, None
+    return meta, body
+
+def _write_cache(url, meta, body=None):
+    """
+    Saves the metadata and, if given, the body of the response for `url`. The body is written first so that cached metadata always has a body.
+    """
+    meta_path, body_path = _cache_paths(url)
+    if body is not None:
+        _write_atomic(body_path, body)
+    _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+def _evict_cache():
+    """
+    Removes the responses used least recently from the cache until it is no larger than its maximum size
+    """
+    if not _cache_settings['enabled'] or _cache_settings['max_bytes'] is None:
+        return
+
+    entries = []
+    for folder, _, names in os.walk(_cache_settings['directory']):
+        for name in names:
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(folder, name)
+            body_path = meta_path[:-len('.json')] + '.body'
+            try:
+                stat = os.stat(meta_path)
+                size = stat.st_size + (os.path.getsize(body_path) if os.path.exists(body_path) else 0)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, size, meta_path, body_path))
+
+    total = sum(size for _, size, _, _ in entries)
+    for _, size, meta_path, body_path in sorted(entries):
+        if total <= _cache_settings['max_bytes']:
+            break
+        for path in [meta_path, body_path]: # Metadata first, so that a body is never read without it
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
+
+def _cached_response(url, meta, body):
+    """
+    Returns: a `requests.Response` rebuilt from cached metadata and body
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = meta['status']
+    response.headers = CaseInsensitiveDict(meta['headers'])
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response._content = body
+    return response
+
+def _get(url, kind='listing', timeout=_timeout):
+    """
+    Parameters:
+        - `url`
+            string, the URL of the page to be retrieved
+        - `kind`
+            string, either 'listing' or 'article'. Determines how long a cached response stays fresh (see `_cache_ttl`)
+        - `timeout`
+            float, the number of seconds to wait for the server to connect or send data
+
+    Returns: the response for `url`. It is read from the cache while fresh, revalidated with a conditional request once stale, and otherwise retrieved through the shared session. A body that has not changed since it was cached is not written again.
+    """
+    if not _cache_settings['enabled']:
+        return _request(url, timeout=timeout)
+
+    meta, body = _read_cache(url)
+
+    if _cache_settings['offline']:
+        if meta is None:
+            warn("Page not found in cache: " + url)
+            return _cached_response(url, {'status' : 404, 'headers' : {}}, b'')
+        _metrics.add(cache_hits=1)
+        return _cached_response(url, meta, body)
+
+    headers = {}
+    if meta is not None:
+        ttl = _cache_ttl[kind]
+        if ttl is None or time.time() - meta['fetched_at'] < ttl.total_seconds():
+            _metrics.add(cache_hits=1)
+            return _cached_response(url, meta, body)
+
+        if 'ETag' in meta['headers']:
+            headers['If-None-Match'] = meta['headers']['ETag']
+        if 'Last-Modified' in meta['headers']:
+            headers['If-Modified-Since'] = meta['headers']['Last-Modified']
+
+    response = _request(url, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and meta is not None: # Unchanged since it was cached
+        meta['fetched_at'] = time.time()
+        _write_cache(url, meta)
+        _metrics.add(cache_hits=1)
+        return _cached_response(url, meta, body)
+
+    if response.status_code == 200:
+        kept_headers = {name : response.headers[name] for name in ['Content-Type', 'ETag', 'Last-Modified'] if name in response.headers}
+        _write_cache(url, {'url' : url, 'status' : 200, 'headers' : kept_headers, 'fetched_at' : time.time()}, response.content if response.content != body else None)
+
+    return response
+
+# HTML parsing shared by every loader
+try:
+    import lxml # Faster than the standard library's parser when it is installed
+    _default_parser = 'lxml'
+except ImportError:
+    _default_parser = 'html.parser'
+_parser_settings = {'parser' : _default_parser}
+
+def configure_parser(parser=_default_parser):
+    """
+    Parameters:
+        - `parser`
+            string, the BeautifulSoup backend used to parse HTML pages (e.g. 'lxml' or 'html.parser'). By default, 'lxml' is used when it is installed.
+    """
+    _parser_settings['parser'] = parser
+
+def _soup(markup, name=None, **attrs):
+    """
+    Parameters:
+        - `markup`
+            string or bytes, the HTML of a page
+        - `name`
+            string or list of strings, the tag name of the elements that are needed from the page. By default, this is set to None, which parses the whole page
+        - `attrs`
+            the attributes that the needed elements must have, as accepted by `BeautifulSoup.find_all` (e.g. `class_="article"`)
+
+    Returns: a BeautifulSoup object for the page. When `name` is given, only the matching elements and their descendants are built; everything else on the page is skipped.
+    """
+    start = time.thread_time()
+    parse_only = SoupStrainer(name, **attrs) if name is not None else None
+    soup = BeautifulSoup(markup, _parser_settings['parser'], parse_only=parse_only)
+    _metrics.add(parse_seconds=time.thread_time() - start)
+    return soup
+
+def _get_article(url):
+    """
+    Returns: the response for the article page at `url`
+    """
+    return _get(url, kind='article')
+
+def _fetch_pages(links, max_workers=_max_workers, get=_get_article):
+    """
+    Parameters:
+        - `links`
+            list of strings, the URLs of the pages to be retrieved
+        - `max_workers`
+            int, the maximum number of pages requested at once
+        - `get`
+            function, retrieves the page at a given URL. By default, this is `_get_article`
+
+    Returns: a list containing the response for each link, in the same order as `links`
+    """
+    if not links:
+        return []
+
+    context = contextvars.copy_context() # Requests are recorded for the province being loaded
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(links)))) as executor:
+        return list(executor.map(lambda link: context.copy().run(get, link), links))
+
+def content_hash(text):
+    """
+    Returns: a hexadecimal SHA-1 digest identifying the given article text, which ignores differences in whitespace, or None if `text` is not a string
+    """
+    if not isinstance(text, str):
+        return None
+    return hashlib.sha1(' '.join(text.split()).encode('utf-8')).hexdigest()
+
+def _fill_hashes(df):
+    """
+    Returns: the given DataFrame with the `content_hash` of each row computed from its full text where it is missing
+    """
+    if 'content_hash' not in df.columns:
+        df['content_hash'] = None
+    df['content_hash'] = df['content_hash'].astype(object) # Read back as a float column of NaN when no row has a hash
+    missing = df['content_hash'].isna()
+    if missing.any():
+        df.loc[missing, 'content_hash'] = df.loc[missing, 'source_full_text'].map(content_hash)
+    return df
+
+def _fetch_articles(entries, parse_body, region, sub_region, max_workers=_max_workers, known_urls=frozenset(), get=_get_article, verbose=True):
+    """
+    Parameters:
+        - `entries`
+            list of (date, title, link) tuples collected from a listing page, in the order they were listed
+        - `parse_body`
+            function, maps the response for an article page to the full text of the article, or None if it could not be found
+        - `region`
+            string, the region of the articles
+        - `sub_region`
+            string, the subregion of the articles
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
+        - `get`
+            function, retrieves the page at a given URL. By default, this is `_get_article`
+        - `verbose`
+            boolean, whether or not the function should print updates
+
+    Returns: a list of rows following the `_columns` schema, in the same order as `entries`. Articles whose full text could not be found are left out.
+    """
+    new_entries = [entry for entry in entries if entry[2] not in known_urls]
+    responses = _fetch_pages([link for _, _, link in new_entries], max_workers=max_workers, get=get)
+
+    rows = []
+    for (ar_date, title, link), response in zip(new_entries, responses):
+        body = parse_body(response)
+        if body is None:
+            if verbose: print("Couldn't retrieve full text for link: ", link)
+            continue
+
+        rows.append([ar_date, _country, region, sub_region, link, _src_cat, title, body, content_hash(body)])
+
+    _metrics.add(articles_skipped=len(entries) - len(new_entries), articles_failed=len(new_entries) - len(rows))
+    return rows
+
+def _load_ontario(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -23,8 +622,12 @@ def _load_ontario(start_date=datetime(2020, 1, 1), end_date=datetime.today(), ve
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of Ontario.
+    Yields: a row following the `_columns` schema for each news release from the government of Ontario
     """    
 
     # Start searching at `end_date` date
@@ -36,43 +639,48 @@ def _load_ontario(start_date=datetime(2020, 1, 1), end_date=datetime.today(), ve
     region = 'Ontario'
     subregion = ''
 
+    def parse_body(response):
+        linksoup = _soup(response.text, 'article')
+        return linksoup.article.text
+
     # Specific structure for news.contario.ca/archive
-    rows = []
     page = 1
     while True:
         if verbose: print('Searching page ', page)
         target = base_url + str(page)
 
-        response = requests.get(target)
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = _get(target)
+        soup = _soup(response.text, 'article')
         articles = soup.findAll('article')
 
         if len(articles) == 0:
             if verbose: print('No articles found.')
-            return pd.DataFrame(rows, columns=_columns)
+            return
 
+        entries = []
+        finished = False
         for article in articles:
-            smallersoup = BeautifulSoup(str(article), "html.parser")
-            link = smallersoup.findAll('a')[0]['href']
-            title = smallersoup.findAll('a')[0].string
-            pub_date = datetime.strptime(smallersoup.time.string.replace('.', ''), "%B %d, %Y %I:%M %p")
+            link = article.findAll('a')[0]['href']
+            title = article.findAll('a')[0].string
+            pub_date = datetime.strptime(article.time.string.replace('.', ''), "%B %d, %Y %I:%M %p")
             
             if pub_date < start_date:
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
 
             if pub_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
             
-            response = requests.get(link)
-            linksoup = BeautifulSoup(response.text, "html.parser")
-            full_text = linksoup.article.text
+            entries.append((pub_date, title, link))
 
-            row = [pub_date, _country, region, subregion, link, _src_cat, title, full_text]
-            rows.append(row)
+        yield from _fetch_articles(entries, parse_body, region, subregion, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
+
+        if finished:
+            return
 
         page += 1
 
-def _load_manitoba(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_manitoba(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -81,9 +689,13 @@ def _load_manitoba(start_date=datetime(2020, 1, 1), end_date=datetime.today(), v
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
     
-    Returns: a DataFrame containing news releases from the government of Manitoba.
+    Yields: a row following the `_columns` schema for each news release from the government of Manitoba
     """
     
     month_start = datetime(start_date.year, start_date.month, 1) # If the date range does not begin on the start of the month it skips the month in its entirety.
@@ -96,29 +708,34 @@ def _load_manitoba(start_date=datetime(2020, 1, 1), end_date=datetime.today(), v
     region = 'Manitoba'
     subregion = ''
     
-    rows = []
     for target in targets:
         if verbose: 
             print('Searching link', target)
         if target.startswith(url_base):
-            response = requests.get(target)
-            soup = BeautifulSoup(response.text, "html.parser")
-            items = soup.findAll("div", {"class": "maincontent"})
-            smallersoup = BeautifulSoup(str(items), "html.parser")
-            for article in smallersoup.findAll('h2'):
+            response = _get(target)
+            soup = _soup(response.text, "div", class_="maincontent")
+            listed = []
+            for article in soup.findAll('h2'):
                 a = article.a
                 relative_link = a['href']
                 link = url_base + relative_link.split('..')[-1]
                 title = a.string
+                if link not in known_urls:
+                    listed.append((title, link))
+                else:
+                    _metrics.add(articles_skipped=1)
+
+            # Publication dates are only found on the article pages themselves, so every listed article that is not yet known is retrieved
+            responses = _fetch_pages([link for _, link in listed], max_workers=max_workers)
 
-                response = requests.get(link)
-                linksoup = BeautifulSoup(response.text, "html.parser")
+            for (title, link), response in zip(listed, responses):
+                linksoup = _soup(response.text) # The date and the text are in separate parts of the page
 
                 date_text = linksoup.findAll("span", {"class": "article_date"})[0].string
                 pub_date = datetime.strptime(date_text, '%B %d, %Y')
                 
                 if pub_date < start_date:
-                    return pd.DataFrame(rows, columns=_columns)
+                    return
 
                 if pub_date > end_date: # Articles that follow the `end_date` parameter are ignored
                     continue
@@ -126,12 +743,10 @@ def _load_manitoba(start_date=datetime(2020, 1, 1), end_date=datetime.today(), v
                 full_text = linksoup.findAll("div", {"class": ""})[0].text
 
 
-                row = [pub_date, _country, region, subregion, link, _src_cat, title, full_text]
-                rows.append(row)
+                row = [pub_date, _country, region, subregion, link, _src_cat, title, full_text, content_hash(full_text)]
+                yield row
 
-    return pd.DataFrame(rows, columns=_columns)
-
-def _load_british_columbia(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_british_columbia(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -140,58 +755,61 @@ def _load_british_columbia(start_date=datetime(2020, 1, 1), end_date=datetime.to
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of British Columbia.
+    Yields: a row following the `_columns` schema for each news release from the government of British Columbia
     """
 
     region = 'British Columbia'
     subregion = ''
 
+    def parse_body(response):
+        linksoup = _soup(response.text, "article")
+        get_article = linksoup.findAll("article")
+        return get_article[0].text if get_article else None
+
     query_url = 'https://news.gov.bc.ca/Search?FromDate=' + start_date.strftime('%Y/%m/%d') + '&toDate=' + end_date.strftime('%Y/%m/%d') + '&Page='
-    rows = []
     page = 1
     
     while True:
         if verbose: print("Page ", page)
         target = query_url + str(page)
-        response = requests.get(target)
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = _get(target)
+        soup = _soup(response.text, "div", class_="article")
         items = soup.findAll("div", {"class": "article"})
 
         if not items:
-            return pd.DataFrame(rows, columns=_columns)
+            return
 
+        entries = []
+        finished = False
         for article in items:
-            smallersoup = BeautifulSoup(str(article), "html.parser")
-
-            title = smallersoup.a.string
+            title = article.a.string
 
-            date_text = smallersoup.findAll("div", {"class" : "item-date"})[0].string
+            date_text = article.findAll("div", {"class" : "item-date"})[0].string
             pub_date = datetime.strptime(date_text, '%A, %B %d, %Y %I:%M %p')
             
             if pub_date < start_date:
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
 
             if pub_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
 
-            link = smallersoup.a['href']
+            link = article.a['href']
+            entries.append((pub_date, title, link))
 
-            response = requests.get(link)
-            linksoup = BeautifulSoup(response.text, "html.parser")
-            get_article = linksoup.findAll("article")
-            if get_article:
-                full_text = get_article[0].text
-            else:
-                if verbose: print("Couldn't retrieve full text for link: ", link)
-                continue
+        yield from _fetch_articles(entries, parse_body, region, subregion, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
 
-            row = [pub_date, _country, region, subregion, link, _src_cat, title, full_text]
-            rows.append(row)
+        if finished:
+            return
 
         page += 1
 
-def _load_new_brunswick(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_new_brunswick(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -200,41 +818,49 @@ def _load_new_brunswick(start_date=datetime(2020, 1, 1), end_date=datetime.today
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
     
-    Returns: a DataFrame containing news releases from the government of New Brunswick.
+    Yields: a row following the `_columns` schema for each news release from the government of New Brunswick
     """
     
     region = 'New Brunswick'
     sub_region = ''
+
+    def parse_body(response):
+        body_soup = _soup(response.content, 'div', class_="articleBody")
+        return body_soup.find('div', class_="articleBody").text
     
     url_base = "https://www2.gnb.ca/"
     url = url_base + "content/gnb/en/news/recent_news.html?mainContent_par_newslist_start="
     start = 0
-    rows = []
     
     while True:
         if verbose: print("Page {}".format(str(start // 25 + 1)))
-        response = requests.get(url + str(start))
-        soup = BeautifulSoup(response.content, "html.parser")
+        response = _get(url + str(start))
+        soup = _soup(response.content, 'div', class_="none padded")
 
         article_div = soup.find('div', class_="none padded")
-        article_soup = BeautifulSoup(str(article_div), 'html.parser')
-        articles = article_soup.find_all('li')
+        articles = article_div.find_all('li') if article_div else []
 
-        if len(articles) == 1: # Only button that says "previous page"
-            return pd.DataFrame(rows, columns=_columns)
+        if len(articles) <= 1: # Only button that says "previous page"
+            return
 
+        entries = []
+        finished = False
         for article in articles:
-            small_soup = BeautifulSoup(str(article), 'html.parser')
-            ar_date_str = small_soup.find('span', class_="post_date")
+            ar_date_str = article.find('span', class_="post_date")
             
             if ar_date_str:
                 ar_date = datetime.strptime(ar_date_str.text, "%d %B %Y")
                 
                 if ar_date < start_date:
                     if verbose: print("Stopping search at date {}".format(ar_date))
-                    return pd.DataFrame(rows, columns=_columns)
+                    finished = True
+                    break
 
                 if ar_date > end_date:
                     continue
@@ -244,16 +870,16 @@ def _load_new_brunswick(start_date=datetime(2020, 1, 1), end_date=datetime.today
 
                 relative_link = a['href']
                 link = url_base + relative_link
-                article_page = requests.get(link)
+                entries.append((ar_date, title, link))
+
+        yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
+
+        if finished:
+            return
 
-                body_soup = BeautifulSoup(article_page.content, 'html.parser')
-                body = body_soup.find('div', class_="articleBody").text
-                
-                row = [ar_date, _country, region, sub_region, link, _src_cat, title, body]
-                rows.append(row)
         start += 25 # articles per page
 
-def _load_nova_scotia(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_nova_scotia(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -262,31 +888,39 @@ def _load_nova_scotia(start_date=datetime(2020, 1, 1), end_date=datetime.today()
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of Nova Scotia. 
+    Yields: a row following the `_columns` schema for each news release from the government of Nova Scotia
     """
 
     region = 'Nova Scotia'
     sub_region = ''
+
+    def parse_body(response):
+        ar_soup = _soup(response.content, 'div', id='releaseBody')
+        return ar_soup.find('div', {'id' : 'releaseBody'}).text
     
     url_base = "https://novascotia.ca/news"
     page = 1
     
-    rows = []
-    
     while True:
         url = url_base + "/search/?page=" + str(page)
         if verbose: print("Searching page {}".format(page))
         
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = _get(url)
+        soup = _soup(response.content, ['dt', 'dd'])
         
         titles = soup.find_all('dt', class_="RelTitle")
         summaries = soup.find_all('dd', class_="RelSummary")
 
         if not (titles or summaries):
-            return pd.DataFrame(rows, columns=_columns)
+            return
 
+        entries = []
+        finished = False
         for title, summary in zip(titles, summaries):
             
             if title['lang'] == "fr": continue
@@ -295,25 +929,24 @@ def _load_nova_scotia(start_date=datetime(2020, 1, 1), end_date=datetime.today()
             
             if ar_date < start_date:
                 if verbose: print("Stopping search at date {}".format(ar_date))
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
             
             if ar_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
             
             relative_link = title.a['href'].split('..', 1)[1]
             link = url_base + relative_link
-            
-            ar_response = requests.get(link)
-            ar_soup = BeautifulSoup(ar_response.content, 'html.parser')
-            body = ar_soup.find('div', {'id' : 'releaseBody'}).text
-            
-            row = [ar_date, _country, region, sub_region, link, _src_cat, title.text, body]
-            rows.append(row)
+            entries.append((ar_date, title.text, link))
+
+        yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
 
+        if finished:
+            return
             
         page += 1
         
-def _load_northwest_territories(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_northwest_territories(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -322,57 +955,65 @@ def _load_northwest_territories(start_date=datetime(2020, 1, 1), end_date=dateti
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of the Northwest Territories.    
+    Yields: a row following the `_columns` schema for each news release from the government of the Northwest Territories
     """
 
     region = 'Northwest Territories'
     sub_region = '' 
+
+    def parse_body(response):
+        ar_soup = _soup(response.content, 'div', class_="field-item even")
+        return ar_soup.find('div', class_ = "field-item even").text
     
     url_base = "https://www.gov.nt.ca/"
     page = 0
     
-    rows = []
-    
     while True:
         url = url_base + "en/newsroom?page=" + str(page)
         if verbose: print("Searching page {}".format(page + 1))
         
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = _get(url)
+        soup = _soup(response.content, 'div', class_=re.compile('views-row'))
         
         ar_boxes = soup.find_all('div', class_ = re.compile('views-row')) # regex accounts for inconsistent `div` class names
         
         if not ar_boxes:
-            return pd.Dataframe(rows, columns=_columns)
+            return
 
+        entries = []
+        finished = False
         for box in ar_boxes:
-            boxed_soup = BeautifulSoup(str(box), 'html.parser') # parse each div
-            date_str = boxed_soup.find('span').text
+            date_str = box.find('span').text
             ar_date = datetime.strptime(date_str, "%B %d, %Y")
             
             if ar_date < start_date: 
                 if verbose: print("Stopping search at date {}".format(ar_date))
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
 
             if ar_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
             
-            title_a = boxed_soup.find('a')
+            title_a = box.find('a')
             title = title_a.text
             relative_link = title_a['href']
             
             link = url_base + relative_link
-            ar_res = requests.get(link)
-            ar_soup = BeautifulSoup(ar_res.content, 'html.parser')
-            body = ar_soup.find('div', class_ = "field-item even").text
-            
-            row = [ar_date, _country, region, sub_region, link, _src_cat, title, body]
-            rows.append(row)
+            entries.append((ar_date, title, link))
+
+        yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
+
+        if finished:
+            return
             
         page += 1
         
-def _load_saskatchewan(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_saskatchewan(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -381,32 +1022,39 @@ def _load_saskatchewan(start_date=datetime(2020, 1, 1), end_date=datetime.today(
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of Saskatchewan.
+    Yields: a row following the `_columns` schema for each news release from the government of Saskatchewan
     """
     
     region = 'Saskatchewan'
     sub_region = ''
+
+    def parse_body(response):
+        body_soup = _soup(response.content, 'section', class_="general-content")
+        return body_soup.find('section', class_="general-content").text
     
     url_base = "https://www.saskatchewan.ca/government/news-and-media?page="
     page = 1
     
-    rows = []
-    
     while True:
         url = url_base + str(page)
         if verbose: print("Searching page {}".format(page))
         
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = _get(url)
+        soup = _soup(response.content, 'ul', class_="results")
         
         article_list = soup.find('ul', class_="results")
-        article_soup = BeautifulSoup(str(article_list), 'html.parser')
-        list_items = article_soup.find_all('li')
+        list_items = article_list.find_all('li') if article_list else []
 
         if not list_items:
-            return pd.DataFrame(rows, columns=_columns)        
+            return
         
+        entries = []
+        finished = False
         for item in list_items:
             
             date_str = item.time['datetime']
@@ -414,23 +1062,24 @@ def _load_saskatchewan(start_date=datetime(2020, 1, 1), end_date=datetime.today(
             
             if ar_date < start_date: 
                 if verbose: print("Stopping search at date {}".format(ar_date))
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
 
             if ar_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
             
             title = item.a.text
             link = item.a['href']
-            
-            body_soup = BeautifulSoup(requests.get(link).content, 'html.parser')
-            body = body_soup.find('section', class_="general-content").text
-            
-            row = [ar_date, _country, region, sub_region, link, _src_cat, title, body]
-            rows.append(row)
+            entries.append((ar_date, title, link))
+
+        yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
+
+        if finished:
+            return
             
         page += 1
         
-def _load_nunavut(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_nunavut(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -439,61 +1088,68 @@ def _load_nunavut(start_date=datetime(2020, 1, 1), end_date=datetime.today(), ve
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of Nunavut.
+    Yields: a row following the `_columns` schema for each news release from the government of Nunavut
     
     Parameters: datetime object, the date of the earliest news release to be retrieved. By default, only the releases published before Jan 1 2020 are retrieved.
     """
 
     region = 'Nunavut'
     sub_region = ''
+
+    def parse_body(response):
+        body_soup = _soup(response.content, 'div', class_="region region-content")
+        return body_soup.find('div', class_="region region-content").text
     
     url_base = "https://gov.nu.ca"
     page = 0
     
-    rows = []
-    
     while True:
         url = url_base + "/news?page=" + str(page)
         if verbose: print("Searching page {}".format(page + 1))
         
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = _get(url)
+        soup = _soup(response.content, 'section', id="block-system-main")
         
         main_section = soup.find('section', {"id" : "block-system-main"})
-        main_section_soup = BeautifulSoup(str(main_section), 'html.parser')
         
-        divs = main_section_soup.find_all('div', re.compile('views-row(.*)'))
+        divs = main_section.find_all('div', re.compile('views-row(.*)')) if main_section else []
 
         if not divs:
-            return pd.DataFrame(rows, columns=_columns)        
+            return
         
+        entries = []
+        finished = False
         for div in divs:
             
-            div_soup = BeautifulSoup(str(div), 'html.parser')
-            date_str = div_soup.find('span', class_="date-display-single").text
+            date_str = div.find('span', class_="date-display-single").text
             ar_date = datetime.strptime(date_str, "%d %B %Y")
             
             if ar_date < start_date: 
                 if verbose: print("Stopping search at date {}".format(ar_date))
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
 
             if ar_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
             
-            a = div_soup.find('a')
+            a = div.find('a')
             title = a.text
             link = url_base + a['href']
-                        
-            body_soup = BeautifulSoup(requests.get(link).content, 'html.parser')
-            body = body_soup.find('div', class_="region region-content").text
-            
-            row = [ar_date, _country, region, sub_region, link, _src_cat, title, body]
-            rows.append(row)
+            entries.append((ar_date, title, link))
+
+        yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
+
+        if finished:
+            return
             
         page += 1
         
-def _load_yukon(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_yukon(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -502,59 +1158,66 @@ def _load_yukon(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verb
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of the Yukon.
+    Yields: a row following the `_columns` schema for each news release from the government of the Yukon
     """
 
     region = 'Yukon'
     sub_region = ''
+
+    def parse_body(response):
+        body_soup = _soup(response.content, 'div', class_="region region-content")
+        return body_soup.find('div', class_="region region-content").text
     
     url_base = "https://yukon.ca"
     page = 0
     
-    rows = []
-    
     while True:
         url = url_base + "/news?page=" + str(page)
         if verbose: print("Searching page {}".format(page + 1))
         
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = _get(url)
+        soup = _soup(response.content, 'div', class_="view-content")
         
         main_div = soup.find('div', class_ = "view-content")
 
         if not main_div:
-            return pd.DataFrame(rows, columns=_columns)
+            return
 
-        main_div_soup = BeautifulSoup(str(main_div), 'html.parser')
-        
-        divs = main_div_soup.find_all('div', re.compile('views-row(.*)'))
+        divs = main_div.find_all('div', re.compile('views-row(.*)'))
         
+        entries = []
+        finished = False
         for div in divs:
             
-            div_soup = BeautifulSoup(str(div), 'html.parser')
-            date_str = div_soup.find('small').text
+            date_str = div.find('small').text
             ar_date = datetime.strptime(date_str, "%B %d, %Y")
             
             if ar_date < start_date: 
                 if verbose: print("Stopping search at date {}".format(ar_date))
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
             
             if ar_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
 
-            a = div_soup.find('a')
+            a = div.find('a')
             title = a.text
             link = url_base + a['href']
-                        
-            body_soup = BeautifulSoup(requests.get(link).content, 'html.parser')
-            body = body_soup.find('div', class_="region region-content").text
-            row = [ar_date, _country, region, sub_region, link, _src_cat, title, body]
-            rows.append(row)
+            entries.append((ar_date, title, link))
+
+        yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
+
+        if finished:
+            return
             
         page += 1
         
-def _load_pei(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_pei(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -563,56 +1226,64 @@ def _load_pei(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbos
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of Prince Edward Island.
+    Yields: a row following the `_columns` schema for each news release from the government of Prince Edward Island
     """
 
     region = 'Prince Edward Island'
     sub_region = ''
+
+    def parse_body(response):
+        body_soup = _soup(response.content, 'div', class_="maincontentmain")
+        return body_soup.find('div', class_="maincontentmain").text
     
     url_base = "https://www.princeedwardisland.ca"
     page = 0
     
-    rows = []
-    
     while True:
         url = url_base + "/news?page=" + str(page)
         if verbose: print("Searching page {}".format(page + 1))
         
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = _get(url)
+        soup = _soup(response.content, 'div', class_="right content views-fieldset")
         
         divs = soup.find_all('div', class_="right content views-fieldset")
 
         if not divs:
-            return pd.DataFrame(rows, columns=_columns)        
+            return
 
+        entries = []
+        finished = False
         for div in divs:
                         
-            div_soup = BeautifulSoup(str(div), 'html.parser')
-            date_str = div_soup.find('div', class_="date").text
+            date_str = div.find('div', class_="date").text
             ar_date = datetime.strptime(date_str, "%A, %B %d, %Y")
             
             if ar_date < start_date: 
                 if verbose: print("Stopping search at date {}".format(ar_date))
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
             
             if ar_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
 
-            a = div_soup.find('a')
+            a = div.find('a')
             title = a.text
             link = url_base + a['href']
-            
-            body_soup = BeautifulSoup(requests.get(link).content, 'html.parser')
-            body = body_soup.find('div', class_="maincontentmain").text
-                        
-            row = [ar_date, _country, region, sub_region, link, _src_cat, title, body]
-            rows.append(row)
+            entries.append((ar_date, title, link))
+
+        yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
+
+        if finished:
+            return
             
         page += 1
         
-def _load_alberta(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_alberta(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -621,25 +1292,33 @@ def _load_alberta(start_date=datetime(2020, 1, 1), end_date=datetime.today(), ve
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of Alberta.
+    Yields: a row following the `_columns` schema for each news release from the government of Alberta
     """
 
     region = 'Alberta'
     sub_region = ''
+
+    def parse_body(response):
+        body_soup = _soup(response.content, 'main')
+        ar_main = body_soup.find('main')
+        return ar_main.find('div', class_="goa-grid-100-100-100").text
     
     days_back = (datetime.today() - start_date).days
     url = "https://www.alberta.ca/NewsRoom/newsroom.cfm?numDaysBack=" + str(days_back + 1)
     
-    rows = []
-    
-    response = requests.get(url)
+    response = _get(url)
     soup = BeautifulSoup(response.content, 'xml')
         
     links = [link.text for link in soup.find_all('link')[2:]] # First two links are not articles
     titles = [title.text for title in soup.find_all('title')[2:]] # First two titles are not articles
     dates = [date.text for date in soup.find_all('pubDate')]
     
+    entries = []
     for link, title, date in zip(links, titles, dates):
         
         ar_date = datetime.strptime(date, "%a, %d %b %Y %H:%M:%S -0600")
@@ -649,17 +1328,11 @@ def _load_alberta(start_date=datetime(2020, 1, 1), end_date=datetime.today(), ve
         
         if verbose: print('Searching date ' + ar_date.strftime('%B %d, %Y'))
 
-        ar_page_soup = BeautifulSoup(requests.get(link).content, 'html.parser')
-        ar_main = ar_page_soup.find('main')
-        body_soup = BeautifulSoup(str(ar_main), 'html.parser')
-        body = body_soup.find('div', class_="goa-grid-100-100-100").text
-        
-        row = [ar_date, _country, region, sub_region, link, _src_cat, title, body]
-        rows.append(row)
-                
-    return pd.DataFrame(rows, columns=_columns)
+        entries.append((ar_date, title, link))
+
+    yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
 
-def _load_quebec(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_quebec(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -668,35 +1341,44 @@ def _load_quebec(start_date=datetime(2020, 1, 1), end_date=datetime.today(), ver
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of Quebec.
+    Yields: a row following the `_columns` schema for each news release from the government of Quebec
     """
     
     region = 'Quebec'
     sub_region = ''
+
+    def parse_body(response):
+        body_soup = _soup(response.content, 'div', class_="article")
+        return body_soup.find('div', class_="article").text
     
     url_base = "http://www.fil-information.gouv.qc.ca/Pages/Articles.aspx?lang=en&Page="
     page = 1
     
-    rows = []
-    
     while True:
         url = url_base + str(page)
         
         if verbose: print("Searching page {}".format(page))
         
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = _get(url)
+        soup = _soup(response.content) # The article sections and the pagination are in separate parts of the page
                 
         sections = soup.find_all('section', {"id" : "articles"})
         
+        entries = []
+        finished = False
         for section in sections:
             date_str = section.time['datetime']
             ar_date = datetime.strptime(date_str, "%Y-%m-%d")
                     
             if ar_date < start_date:
                 if verbose: print("Stopping search at date {}".format(ar_date))
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
             
             if ar_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
@@ -707,20 +1389,20 @@ def _load_quebec(start_date=datetime(2020, 1, 1), end_date=datetime.today(), ver
                 link = a['href']
                 title = a.text.replace('\r', '')
                 title = title.replace('\n', '')
+                entries.append((ar_date, title, link))
 
-                body_soup = BeautifulSoup(requests.get(link).content, 'html.parser')
-                body = body_soup.find('div', class_="article").text
+        yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
 
-                row = [ar_date, _country, region, sub_region, link, _src_cat, title, body]
-                rows.append(row)
+        if finished:
+            return
         
         if not soup.find('li', class_='last'): # No 'go to last page' indicates that this is the last page
             if verbose: print("Stopping search at date {}".format(ar_date))
-            return pd.DataFrame(rows, columns=_columns)
+            return
 
         page += 1
 
-def _load_newfoundland(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _load_newfoundland(start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
     Parameters: 
         - `start_date` 
@@ -729,34 +1411,41 @@ def _load_newfoundland(start_date=datetime(2020, 1, 1), end_date=datetime.today(
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of Newfoundland.
+    Yields: a row following the `_columns` schema for each news release from the government of Newfoundland
     """
 
     region = 'Newfoundland and Labrador'
     sub_region = ''
+
+    def parse_body(response):
+        body_soup = _soup(response.content, 'div', class_="entry-content")
+        return body_soup.find('div', class_ = "entry-content").text
     
     current_year = datetime.today().year
     
-    rows = []
-    
     for year in range(current_year, start_date.year - 1, -1): # Searches range backwards
         url = "https://www.gov.nl.ca/releases/r/?ny=" + str(year) + "&nm=&ntype=&ndept="
 
-        http = urllib3.PoolManager()
-
-        response = http.request('GET', url)
-        soup = BeautifulSoup(response.data, 'html.parser')
+        response = _get(url)
+        soup = _soup(response.content, 'div', class_="news-results")
         news_results = soup.find('div', class_ = "news-results")
         dates = news_results.find_all('h2')
         ar_lists = news_results.find_all('ul')
         
 
+        entries = []
+        finished = False
         for date, ar_list in zip(dates, ar_lists):
             ar_date = datetime.strptime(date.text + " " + str(year), "%B %d %Y")
 
             if ar_date < start_date:
-                return pd.DataFrame(rows, columns=_columns)
+                finished = True
+                break
 
             if ar_date > end_date: # Articles that follow the `end_date` parameter are ignored
                 continue
@@ -766,62 +1455,155 @@ def _load_newfoundland(start_date=datetime(2020, 1, 1), end_date=datetime.today(
             for article in ar_list:
                 title = article.a.text
                 link = article.a['href']
-                
-                body_response = http.request('GET', link)
-                body_soup = BeautifulSoup(body_response.data, 'html.parser')
-                body = body_soup.find('div', class_ = "entry-content").text
-                                
-                row = [ar_date, _country, region, sub_region, link, _src_cat, title, body]
-                rows.append(row)
-    
-    return pd.DataFrame(rows, columns=_columns)
+                entries.append((ar_date, title, link))
+
+        yield from _fetch_articles(entries, parse_body, region, sub_region, max_workers=max_workers, known_urls=known_urls, verbose=verbose)
+
+        if finished:
+            return
+
+
+_loaders = {'alberta' : _load_alberta,
+            'british columbia' : _load_british_columbia,
+            'manitoba' : _load_manitoba,
+            'new brunswick' : _load_new_brunswick,
+            'newfoundland' : _load_newfoundland,
+            'northwest territories' : _load_northwest_territories,
+            'nova scotia' : _load_nova_scotia,
+            'nunavut' : _load_nunavut,
+            'ontario' : _load_ontario,
+            'pei' : _load_pei,
+            'quebec' : _load_quebec,
+            'saskatchewan' : _load_saskatchewan,
+            'yukon' : _load_yukon,
+           }
 
-def _load_province(province, start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True):
+def _iter_province(province, start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
     """
-    Parameters: 
+    Parameters:
         - `province`
             string, represents the name of the province or territory whose releases are to be retrieved
-        - `start_date` 
+        - `start_date`
             datetime object, the date of the earliest news release to be retrieved. By default, only the releases published before Jan 1 2020 are retrieved
-         - `end_date` 
+         - `end_date`
             datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
         - `verbose`
             boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
 
-    Returns: a DataFrame containing news releases from the government of the specified province or territory.
-    """
-
-    switcher = {'alberta' : _load_alberta, 
-            'british columbia' : _load_british_columbia, 
-            'manitoba' : _load_manitoba, 
-            'new brunswick' : _load_new_brunswick, 
-            'newfoundland' : _load_newfoundland,
-            'northwest territories' : _load_northwest_territories, 
-            'nova scotia' : _load_nova_scotia, 
-            'nunavut' : _load_nunavut, 
-            'ontario' : _load_ontario, 
-            'pei' : _load_pei, 
-            'quebec' : _load_quebec, 
-            'saskatchewan' : _load_saskatchewan, 
-            'yukon' : _load_yukon,
-           }
+    Yields: a row following the `_columns` schema for each news release from the government of the specified province or territory, starting with the ones saved in its journal by an interrupted search.
 
-    if province.lower() not in switcher:
-        warn("Province \'{}\' not recognized".format(province))
-        return None
+    Each article is saved to the province's journal as soon as it is retrieved. If the search fails, the error is raised and the journal is kept, so that the next search resumes from it instead of retrieving the same articles again. Once a search completes, only the articles between its `start_date` and `end_date` are removed from the journal, so that those kept by another interrupted search of the province are not lost.
+    """
 
     if verbose: print("\nLoading {} Releases between {} and {}\n".format(province.upper(), start_date.strftime('%B %d, %Y'), end_date.strftime('%B %d, %Y')))
 
     if start_date > end_date:
         if verbose: print("Cannot search between {} and {}".format(start_date, end_date))
-        return pd.DataFrame([], columns=_columns)
+        return
 
+    rows = [row for row in _read_journal(province) if start_date <= row[0] <= end_date]
+    if rows and verbose: print("Resuming from {} articles retrieved by an interrupted search".format(len(rows)))
+    known_urls = set(known_urls).union(row[4] for row in rows)
+    yield from rows
+
+    start = time.perf_counter()
     try:
-        df = switcher[province.lower()](start_date=start_date, end_date=end_date, verbose=verbose)
-    except:
-        df = pd.DataFrame([], columns=_columns)
+        os.makedirs(os.path.dirname(_journal_path(province)), exist_ok=True)
+        with open(_journal_path(province), 'a', encoding='utf-8') as journal:
+            for row in _loaders[province.lower()](start_date=start_date, end_date=end_date, verbose=verbose, max_workers=max_workers, known_urls=known_urls):
+                journal.write(json.dumps([row[0].isoformat()] + row[1:]) + '\n')
+                journal.flush()
+                yield row
+    finally:
+        _metrics.add(province.lower(), search_seconds=time.perf_counter() - start)
+
+    _trim_journal(province, start_date, end_date)
+    _evict_cache()
+
+def _load_province(province, start_date=datetime(2020, 1, 1), end_date=datetime.today(), verbose=True, max_workers=_max_workers, known_urls=frozenset()):
+    """
+    Parameters:
+        - `province`
+            string, represents the name of the province or territory whose releases are to be retrieved
+        - `start_date`
+            datetime object, the date of the earliest news release to be retrieved. By default, only the releases published before Jan 1 2020 are retrieved
+         - `end_date`
+            datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
+        - `verbose`
+            boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `known_urls`
+            set of strings, the URLs of articles that have already been retrieved. Their pages are not requested again.
+
+    Returns: a DataFrame containing news releases from the government of the specified province or territory, or an empty DataFrame if the search failed. The articles retrieved by a failed search are kept in the province's journal for the next search.
+    """
+
+    if province.lower() not in _loaders:
+        warn("Province \'{}\' not recognized".format(province))
+        return None
+
+    rows = []
+    token = _current_province.set(province.lower())
+    try:
+        for row in _iter_province(province, start_date=start_date, end_date=end_date, verbose=verbose, max_workers=max_workers, known_urls=known_urls):
+            rows.append(row)
+    except Exception:
         print("Could not load new articles for province", province)
-    return df
+        if verbose: print("{} articles are kept in {} for the next search".format(len(rows), _journal_path(province)))
+        _metrics.add(failures=1)
+        return pd.DataFrame([], columns=_columns)
+    finally:
+        _current_province.reset(token)
+
+    return pd.DataFrame(rows, columns=_columns)
+
+def _journal_path(province):
+    """
+    Returns the relative path of the journal of articles retrieved by the current search for a given province string
+    """
+    return 'sources/.journal/' + province.replace(' ', '').lower() + '.jsonl'
+
+def _read_journal(province):
+    """
+    Returns: the rows saved in the journal of the given province by an interrupted search, following the `_columns` schema. A line cut short by the interruption is ignored.
+    """
+    rows = []
+    try:
+        with open(_journal_path(province), encoding='utf-8') as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                rows.append([datetime.fromisoformat(row[0])] + row[1:8] + [content_hash(row[7])])
+    except OSError:
+        pass
+    return rows
+
+def _trim_journal(province, start_date, end_date):
+    """
+    Removes the rows dated between `start_date` and `end_date` from the journal of the given province, and the journal itself once it has no rows left
+    """
+    path = _journal_path(province)
+    kept = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                date = datetime.fromisoformat(json.loads(line)[0])
+            except ValueError:
+                continue
+            if not start_date <= date <= end_date:
+                kept.append(line if line.endswith('\n') else line + '\n')
+
+    if kept:
+        _write_atomic(path, ''.join(kept).encode('utf-8'))
+    else:
+        os.remove(path)
 
 def _csv_path(province):
     """
@@ -829,37 +1611,363 @@ def _csv_path(province):
     """
     return 'sources/' + province.replace(' ', '').lower() + '.csv'
 
-def load_province(province, start_date=None, end_date=datetime.today(), update_csv=False, verbose=True):
+_index_columns = {'url' : 'source_url', 'hash' : 'content_hash'} # Column whose values are saved by each kind of index
+
+def _index_path(province, kind='url'):
     """
-    Parameters: 
+    Returns the relative path of the index of known article URLs (`kind` 'url') or content hashes (`kind` 'hash') for a given province string
+    """
+    return 'sources/.index/' + province.replace(' ', '').lower() + ('.txt' if kind == 'url' else '.' + kind + '.txt')
+
+def _read_index(province, kind='url'):
+    """
+    Returns: the set of article URLs (`kind` 'url') or content hashes (`kind` 'hash') already retrieved for the given province, or None if no index has been saved yet
+    """
+    try:
+        with open(_index_path(province, kind), encoding='utf-8') as f:
+            return set(line.rstrip('\n') for line in f if line.strip())
+    except OSError:
+        return None
+
+def _update_index(province, values, known_values=frozenset(), kind='url'):
+    """
+    Parameters:
         - `province`
-            string, the name of the province or territory to be loaded
-        - `start_date` 
-            datetime object, the date of the earliest news release to be retrieved. By default, this is set to None, which indicates that the program should begin searching from the last possible date in the CSV
-         - `end_date` 
-            datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
-        - `update_csv`
-            boolean, whether or not the results from the search should be saved to a CSV. By default, this is set to False.
-        - `verbose`
-            boolean, whether or not the function should print updates
+            string, the name of the province or territory whose index is updated
+        - `values`
+            iterable of strings, the article URLs (`kind` 'url') or content hashes (`kind` 'hash') that have been retrieved
+        - `known_values`
+            set of strings, the values already saved in the index
+        - `kind`
+            string, the kind of index to update
+
+    Appends the values of `values` that are not already in `known_values` to the index of the given province.
+    """
+    new_values = [value for value in dict.fromkeys(values) if isinstance(value, str) and value not in known_values]
+    if not new_values:
+        return
 
-    Returns: a DataFrame containing news releases from the government of the specified province or territory.
+    os.makedirs(os.path.dirname(_index_path(province, kind)), exist_ok=True)
+    with open(_index_path(province, kind), 'a', encoding='utf-8') as f:
+        f.write(''.join(value + '\n' for value in new_values))
+
+def _synced_size_path(province):
     """
+    Returns the relative path of the file recording the size of the CSV of a given province string when its Parquet files and indexes were last brought in line with it
+    """
+    return 'sources/.index/' + province.replace(' ', '').lower() + '.csv-size'
 
+def _record_csv_size(province):
+    """
+    Records the current size of the CSV of the given province, once its Parquet files and indexes hold every article in it
+    """
     try:
-        province_df = pd.read_csv(_csv_path(province))
-        errant_columns = [col for col in province_df.columns if col not in _columns]
-        province_df = province_df.drop(errant_columns, axis=1)
+        size = os.path.getsize(_csv_path(province))
+    except OSError:
+        return
+    _write_atomic(_synced_size_path(province), str(size).encode('utf-8'))
 
-        start_length = len(province_df.index)
+def _sync_with_csv(province):
+    """
+    Brings the Parquet files and indexes of the given province in line with its CSV, if the CSV has changed since they were last saved. The CSVs are kept in git while the Parquet files and indexes are only cached between runs, so a cache restored from an older run can be missing articles found since. The articles of the CSV are then merged into the Parquet files, and the indexes are removed, to be rebuilt from the saved articles when they are next needed.
+    """
+    try:
+        size = os.path.getsize(_csv_path(province))
+    except OSError:
+        return
+    try:
+        with open(_synced_size_path(province), encoding='utf-8') as f:
+            synced_size = int(f.read())
+    except (OSError, ValueError):
+        synced_size = None
+
+    if synced_size == size and (_storage_settings['backend'] == 'csv' or _partitions(province)):
+        return
+
+    if _storage_settings['backend'] != 'csv':
+        _merge_csv(province)
+    for kind in _index_columns:
+        if os.path.exists(_index_path(province, kind)):
+            os.remove(_index_path(province, kind))
+    _record_csv_size(province)
+
+# Storage of retrieved articles
+try:
+    import pyarrow # Needed by pandas to read and write Parquet files
+    _default_storage = 'parquet'
+except ImportError:
+    _default_storage = 'csv'
+_storage_settings = {'backend' : _default_storage, 'directory' : 'sources/.store'}
+
+def configure_storage(backend=_default_storage, directory='sources/.store'):
+    """
+    Parameters:
+        - `backend`
+            string, how retrieved articles are saved. With 'parquet', the articles of each province or territory are saved in one compressed Parquet file per month, so that loading a range of dates only reads the months it covers, and saving new articles only rewrites the months they belong to. The CSVs in `sources/` are then kept up to date as an export. With 'csv', each CSV is read and rewritten in full. By default, 'parquet' is used when pyarrow is installed.
+        - `directory`
+            string, the path of the directory in which Parquet files are saved
+
+    Should be used consistently across runs, since articles saved by one backend are not seen by the other, apart from each CSV being merged into the Parquet files when the Parquet backend loads a province whose CSV has changed since its articles were last saved, such as the first time.
+    """
+    _storage_settings['backend'] = backend
+    _storage_settings['directory'] = directory
+
+def _partition_dir(province):
+    """
+    Returns the path of the directory containing the monthly Parquet files of a given province string
+    """
+    return os.path.join(_storage_settings['directory'], province.replace(' ', '').lower())
+
+def _partitions(province):
+    """
+    Returns: a list of (month, path) tuples for the Parquet files of the given province, with months given as 'YYYY-MM' strings, from the most recent month to the oldest
+    """
+    try:
+        names = os.listdir(_partition_dir(province))
+    except OSError:
+        return []
+    months = sorted((name[:-len('.parquet')] for name in names if name.endswith('.parquet')), reverse=True)
+    return [(month, os.path.join(_partition_dir(province), month + '.parquet')) for month in months]
+
+def _read_partition(path, columns=None):
+    """
+    Returns: a DataFrame containing the articles saved in the Parquet file at `path`, restricted to `columns` if given
+    """
+    return pd.read_parquet(path, columns=columns)
+
+def _write_partitions(province, rows):
+    """
+    Parameters:
+        - `province`
+            string, the name of the province or territory whose articles are saved
+        - `rows`
+            list of rows following the `_columns` schema
+
+    Merges the given rows into the Parquet files of the months they belong to. Only those files are rewritten, each one atomically. Articles with the same content hash as a saved one are dropped, and the articles of each month are sorted from the most recent to the oldest.
+    """
+    df = _fill_hashes(pd.DataFrame(rows, columns=_columns))
+    df['start_date'] = pd.to_datetime(df['start_date'])
+    df = df.dropna(subset=['start_date']) # Every article belongs to the month it was published in
+
+    os.makedirs(_partition_dir(province), exist_ok=True)
+    for month, month_df in df.groupby(df['start_date'].dt.strftime('%Y-%m'), sort=False):
+        path = os.path.join(_partition_dir(province), month + '.parquet')
+        if os.path.exists(path):
+            month_df = pd.concat([month_df, _read_partition(path)], ignore_index=True)
+
+        month_df = month_df.drop_duplicates(['content_hash'])
+        month_df = month_df.sort_values('start_date', ascending=False, kind='mergesort')
+
+        data = month_df.to_parquet(None, index=False, compression='zstd')
+        _write_atomic(path, data)
+
+def _import_csv(province):
+    """
+    Saves the articles of the CSV of the given province as Parquet files, if it has none yet. Raises an error if neither exist.
+    """
+    if not _partitions(province):
+        _merge_csv(province)
+
+def _merge_csv(province):
+    """
+    Merges the articles of the CSV of the given province into its Parquet files. Articles already saved are left as they are.
+    """
+    df = pd.read_csv(_csv_path(province))
+    df = df.drop([col for col in df.columns if col not in _columns], axis=1)
+    _write_partitions(province, df.reindex(columns=_columns).values.tolist())
+
+def _stored_dates(province):
+    """
+    Returns: the dates of the earliest and the latest articles saved for the given province. Raises an error if none have been saved.
+    """
+    if _storage_settings['backend'] == 'csv':
+        dates = pd.to_datetime(pd.read_csv(_csv_path(province), usecols=['start_date'])['start_date'])
+        return dates.min(), dates.max()
+
+    _import_csv(province)
+    partitions = _partitions(province)
+    earliest = _read_partition(partitions[-1][1], columns=['start_date'])['start_date'].min()
+    latest = _read_partition(partitions[0][1], columns=['start_date'])['start_date'].max()
+    return earliest, latest
+
+def _stored_values(province, column):
+    """
+    Returns: the set of values of the given column, such as 'source_url' or 'content_hash', for the articles saved for the given province
+    """
+    if _storage_settings['backend'] == 'csv':
+        df = pd.read_csv(_csv_path(province), usecols=lambda name: name in (column, 'source_full_text'))
+        if column == 'content_hash':
+            df = _fill_hashes(df)
+        return set(df[column].dropna())
+
+    return set(value for _, path in _partitions(province) for value in _read_partition(path, columns=[column])[column].dropna())
+
+def _read_csv_rows(province, chunksize=_csv_chunksize):
+    """
+    Yields: the rows saved in the CSV of the given province, following the `_columns` schema. The CSV is read `chunksize` rows at a time.
+    """
+    for chunk in pd.read_csv(_csv_path(province), chunksize=chunksize):
+        chunk = _fill_hashes(chunk.reindex(columns=_columns))
+        chunk['start_date'] = pd.to_datetime(chunk['start_date'])
+        for row in chunk.itertuples(index=False, name=None):
+            yield list(row)
+
+def _read_stored_rows(province, start_date=None, end_date=None):
+    """
+    Yields: the rows saved for the given province, following the `_columns` schema. With the Parquet backend, rows are yielded from the most recent to the oldest, only the articles published between `start_date` and `end_date` are read, and only the files of the months between them are opened. With the CSV backend, every row of the CSV is yielded in the order of the file.
+    """
+    if _storage_settings['backend'] == 'csv':
+        yield from _read_csv_rows(province)
+        return
+
+    first_month = start_date.strftime('%Y-%m') if start_date is not None else None
+    last_month = end_date.strftime('%Y-%m') if end_date is not None else None
+    for month, path in _partitions(province):
+        if (first_month is not None and month < first_month) or (last_month is not None and month > last_month):
+            continue
+
+        df = _read_partition(path)
+        if start_date is not None:
+            df = df[df['start_date'] >= start_date]
+        if end_date is not None:
+            df = df[df['start_date'] <= end_date]
+        for row in df.reindex(columns=_columns).itertuples(index=False, name=None):
+            yield list(row)
+
+def _append_atomic(path, data):
+    """
+    Appends the bytes `data` to `path`. If the write fails, the file is truncated back to its previous length, so that an interrupted write does not leave part of a row behind.
+    """
+    with open(path, 'ab') as f:
+        size = f.tell()
+        try:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.truncate(size)
+            raise
+
+def _csv_bytes(df, header=True):
+    """
+    Returns: the given DataFrame written as CSV bytes, without its index
+    """
+    return df.to_csv(index=False, header=header, lineterminator='\n').encode('utf-8')
+
+def append_csv(path, df, sort_by=_csv_order):
+    """
+    Parameters:
+        - `path`
+            string, the path of the CSV to which rows are added
+        - `df`
+            DataFrame, the rows to be added, which should not already be in the CSV
+        - `sort_by`
+            list of strings, the columns by which the added rows are sorted. By default, rows are sorted by date, then by URL.
+
+    Appends the rows of `df` to the end of the CSV at `path`, in a deterministic order and without the DataFrame index, so that the file only grows by the new rows. The CSV is created if it does not exist. A CSV whose columns differ from those of `df`, such as one written with its index by earlier versions, is rewritten once, atomically, with its rows sorted the same way.
+    """
+    df = df.sort_values(sort_by, kind='mergesort')
+
+    try:
+        columns = list(pd.read_csv(path, nrows=0).columns)
+    except (OSError, ValueError): # Missing or empty file
+        _write_atomic(path, _csv_bytes(df))
+        return
+
+    if columns != list(df.columns):
+        existing = pd.read_csv(path)
+        existing = existing.drop([col for col in existing.columns if col.startswith('Unnamed')], axis=1)
+        existing = existing.reindex(columns=df.columns)
+        if 'content_hash' in existing.columns:
+            existing = _fill_hashes(existing)
+        existing['start_date'] = pd.to_datetime(existing['start_date'])
+        _write_atomic(path, _csv_bytes(pd.concat([existing.sort_values(sort_by, kind='mergesort'), df], ignore_index=True)))
+        return
+
+    with open(path, 'rb') as f: # Rows are only ever added on a new line
+        f.seek(-1, os.SEEK_END)
+        separator = b'' if f.read(1) == b'\n' else b'\n'
+    _append_atomic(path, separator + _csv_bytes(df, header=False))
+
+def export_csv(province):
+    """
+    Parameters:
+        - `province`
+            string, the name of the province or territory whose CSV is written
+
+    Writes every article saved for the given province to its CSV in `sources/`, sorted by date and URL. New articles are then appended to it by `load_province` as they are saved with the Parquet backend.
+    """
+    df = pd.DataFrame(list(_read_stored_rows(province)), columns=_columns)
+    _write_atomic(_csv_path(province), _csv_bytes(df.sort_values(_csv_order, kind='mergesort')))
+
+def _batched(rows, batch_size=None):
+    """
+    Yields: the given rows one at a time if `batch_size` is None, or else lists of up to `batch_size` rows
+    """
+    if batch_size is None:
+        yield from rows
+        return
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _clean_row(row):
+    """
+    Returns: the given row with line breaks replaced by spaces in each of its strings
+    """
+    return [value.replace('\n', ' ').replace('\r', ' ') if isinstance(value, str) else value for value in row]
+
+def _iter_articles(province, start_date=None, end_date=datetime.today(), verbose=True, max_workers=_max_workers, failures=None, added=None):
+    """
+    Yields the rows of `iter_province_articles`. The name of each search that fails is appended to `failures`, and each new row that is yielded is appended to `added`.
+    """
+
+    rows = _iter_articles_in_context(province, start_date=start_date, end_date=end_date, verbose=verbose, max_workers=max_workers, failures=failures, added=added)
+    try:
+        while True:
+            # Telemetry recorded while loading is attributed to this province, only while the loader runs, so that it does not leak into the caller or into other generators while this one is suspended
+            token = _current_province.set(province.lower())
+            try:
+                row = next(rows)
+            except StopIteration:
+                return
+            finally:
+                _current_province.reset(token)
+            yield row
+    finally:
+        token = _current_province.set(province.lower())
+        try:
+            rows.close()
+        finally:
+            _current_province.reset(token)
+
+def _iter_articles_in_context(province, start_date=None, end_date=datetime.today(), verbose=True, max_workers=_max_workers, failures=None, added=None):
+    """
+    Yields the rows of `_iter_articles`, once the province being loaded has been recorded for telemetry
+    """
+
+    searches = [] # (name, start_date, end_date, known_urls) of each search to run around the saved articles
+    stored_rows = []
+    try:
+        _sync_with_csv(province)
+        earliest_date, largest_date = _stored_dates(province)
+        stored_rows = _read_stored_rows(province, start_date=start_date, end_date=end_date)
+
+        known_urls = _read_index(province)
+        if known_urls is None: # Indexes built from the saved articles the first time they are needed
+            known_urls = _stored_values(province, 'source_url')
+        known_hashes = _read_index(province, kind='hash')
+        if known_hashes is None:
+            known_hashes = _stored_values(province, 'content_hash')
 
-        province_df["start_date"] = pd.to_datetime(province_df["start_date"])
-        
         # Get dates later than in the CSV, unless the `start_date` parameter is not None and gives a later date on which to begin searching. If it's None, a default value of Jan 1 2020 is used.
-        largest_date = province_df["start_date"].max()
-        new_start = max(largest_date, start_date or datetime(2020, 1, 1))    
-        late_additions = _load_province(province, start_date=new_start, end_date=end_date, verbose=verbose)
-        df = late_additions.append(province_df)
+        searches.append(('late', max(largest_date, start_date or datetime(2020, 1, 1)), end_date, known_urls))
 
         # Get dates earlier than in the CSV, unless the `end_date` parameter gives an earlier date on which to stop searching
         # end_date=datetime.today() sets the parameter to a default value and allows the program to avoid coslty searches before beginning date.
@@ -867,32 +1975,209 @@ def load_province(province, start_date=None, end_date=datetime.today(), update_c
             if start_date < datetime(2020, 1, 1):
                 warn('WARNING: Going back further than government news websites extend may lead to unexpected behaviour.')
 
-            earliest_date = province_df["start_date"].min()
-            early_additions = _load_province(province, start_date=start_date, end_date=min(end_date, earliest_date), verbose=verbose)  
-            df = df.append(early_additions)
-                
+            searches.append(('early', start_date, min(end_date, earliest_date), known_urls))
     except:
-        start_length = 0
-        print("Could not read file with path", _csv_path(province))
-        df = _load_province(province, start_date=(start_date or datetime(2020, 1, 1)), end_date=end_date, verbose=verbose)
-        
+        print("Could not read saved articles for province", province)
+        searches = [('new', start_date or datetime(2020, 1, 1), end_date, set())]
+        known_hashes = set()
+
+    def search(name, start_date, end_date, known_urls):
+        try:
+            yield from _iter_province(province, start_date=start_date, end_date=end_date, verbose=verbose, max_workers=max_workers, known_urls=known_urls)
+        except Exception:
+            print("Could not load new articles for province", province)
+            if verbose: print("Articles retrieved so far are kept in {} for the next search".format(_journal_path(province)))
+            _metrics.add(failures=1)
+            if failures is not None: failures.append(name)
+
+    # Same order as the DataFrame built by earlier versions: later articles, then the saved ones, then earlier articles
+    sources = [(search(*searches[0]), True), (stored_rows, False)] + [(search(*s), True) for s in searches[1:]]
+
+    seen = set() # Content hashes yielded so far, since duplicate releases are dropped
+    added_count = 0
+    for rows, new in sources:
+        for row in rows:
+            row = _clean_row(row)
+            if row[8] in seen or (new and row[8] in known_hashes): # New articles whose text is already saved are left out
+                if new: _metrics.add(articles_skipped=1)
+                continue
+            seen.add(row[8])
+            if new:
+                _metrics.add(articles_new=1)
+                added_count += 1
+                if added is not None: added.append(row)
+            yield row
 
-    object_columns = df.dtypes[df.dtypes == 'object'].index.values
-    df[object_columns] = df[object_columns].replace('\n',' ', regex=True)
-    df[object_columns] = df[object_columns].replace('\r',' ', regex=True)
-    
-    df = df.drop_duplicates(['source_full_text']) # Potentially useful to look into dropping duplicates based on other attributes
-    end_length = len(df.index)
+    if verbose:
+        print('Articles added: ' + str(added_count))
 
-    if update_csv:
-        df.to_csv(_csv_path(province))
+def iter_province_articles(province, start_date=None, end_date=datetime.today(), verbose=True, max_workers=_max_workers, batch_size=None):
+    """
+    Parameters:
+        - `province`
+            string, the name of the province or territory to be loaded
+        - `start_date`
+            datetime object, the date of the earliest news release to be retrieved. By default, this is set to None, which indicates that the program should begin searching from the last possible date in the CSV
+         - `end_date`
+            datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
+        - `verbose`
+            boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+        - `batch_size`
+            int, the number of rows yielded together in a list. By default, this is set to None, which yields rows one at a time
 
-    if verbose:
-        print('Articles added: ' + str(end_length - start_length))
+    Yields: a row following the `_columns` schema for each news release from the government of the specified province or territory, as soon as it is retrieved or read from storage. These are the rows of the DataFrame returned by `load_province`, in the same order. With the Parquet backend, saved articles published after `end_date`, or before `start_date` when it is given, are not read.
+
+    Only a small number of rows are held in memory at once, so that later stages can process each article while the next ones are still being retrieved. If a search fails, the articles it retrieved have already been yielded; they are kept in the province's journal and yielded again by the next search.
+    """
+    if province.lower() not in _loaders:
+        warn("Province \'{}\' not recognized".format(province))
+        return iter(())
+
+    return _batched(_iter_articles(province, start_date=start_date, end_date=end_date, verbose=verbose, max_workers=max_workers), batch_size)
+
+def load_province(province, start_date=None, end_date=datetime.today(), update_csv=False, verbose=True, max_workers=_max_workers):
+    """
+    Parameters:
+        - `province`
+            string, the name of the province or territory to be loaded
+        - `start_date`
+            datetime object, the date of the earliest news release to be retrieved. By default, this is set to None, which indicates that the program should begin searching from the last possible date in the CSV
+         - `end_date`
+            datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
+        - `update_csv`
+            boolean, whether or not the results from the search should be saved, along with the CSV. By default, this is set to False. Nothing is saved if a search fails, so that the next search covers the same dates. See `configure_storage` for how articles are saved.
+        - `verbose`
+            boolean, whether or not the function should print updates
+        - `max_workers`
+            int, the maximum number of article pages requested at once
+
+    Returns: a DataFrame containing news releases from the government of the specified province or territory.
+    """
+
+    if province.lower() not in _loaders:
+        warn("Province \'{}\' not recognized".format(province))
+        return None
+
+    failures = []
+    added = []
+    df = pd.DataFrame(list(_iter_articles(province, start_date=start_date, end_date=end_date, verbose=verbose, max_workers=max_workers, failures=failures, added=added)), columns=_columns)
+
+    if update_csv and failures:
+        print("Not saving the articles of {}, since the search for {} articles failed".format(province, ' and '.join(failures)))
+    elif update_csv:
+        if added and _storage_settings['backend'] != 'csv':
+            _write_partitions(province, added)
+
+        if _storage_settings['backend'] != 'csv' and not os.path.exists(_csv_path(province)):
+            export_csv(province)
+        elif added:
+            append_csv(_csv_path(province), pd.DataFrame(added, columns=_columns))
+
+        for kind, column in _index_columns.items():
+            known_values = _read_index(province, kind)
+            if known_values is None:
+                _update_index(province, _stored_values(province, column), kind=kind)
+            else:
+                _update_index(province, [row[_columns.index(column)] for row in added], known_values, kind=kind)
+        _record_csv_size(province) # The Parquet files and indexes now hold every article of the CSV
 
     return df
 
-def load_provinces(start_date=None, end_date=datetime.today(), update_csv=False, verbose=False):
+def _iter_province_isolated(province, **kwargs):
+    """
+    Calls `iter_province_articles` for the given province, passing along `kwargs`. Any error is reported as a warning instead of being raised, so that one province cannot interrupt the loading of the others.
+
+    Yields: the rows of `iter_province_articles` for the specified province or territory
+    """
+    try:
+        yield from iter_province_articles(province, **kwargs)
+    except Exception as e:
+        warn("Could not load province \'{}\': {}".format(province, e))
+        _metrics.add(province.lower(), failures=1)
+
+def iter_all_articles(start_date=None, end_date=datetime.today(), verbose=False, max_workers=_max_workers, batch_size=None, parallel=False, max_provinces=None):
+    """
+    Parameters:
+        - `start_date`
+            datetime object, the date of the earliest news release to be retrieved. By default, this is set to None, which indicates that the program should begin searching from the last possible date in the CSV
+        - `end_date`
+            datetime object, the date of the latest news release to be retrieved. By default, this is set to the current date
+        - `verbose`
+            boolean, whether or not the function should print updates (False by default)
+        - `max_workers`
+            int, the maximum number of article pages each loader requests at once
+        - `batch_size`
+            int, the number of rows yielded together in a list. By default, this is set to None, which yields rows one at a time
+        - `parallel`
+            boolean, whether or not the provinces and territories should be loaded at the same time (False by default). Rows are then yielded in the order they are retrieved, and at most `_queue_size` of them wait to be consumed.
+        - `max_provinces`
+            int, the maximum number of provinces and territories loaded at once when `parallel` is True. By default, all of them are loaded at once
+
+    Yields: a row following the `_columns` schema for each news release from every province and territory. Rows are yielded province by province, unless `parallel` is True.
+    """
+
+    kwargs = dict(start_date=start_date, end_date=end_date, verbose=verbose, max_workers=max_workers)
+
+    if not parallel:
+        rows = (row for province in _provinces for row in _iter_province_isolated(province, **kwargs))
+        yield from _batched(rows, batch_size)
+        return
+
+    rows = queue.Queue(maxsize=_queue_size)
+    stop = threading.Event() # Set when the caller stops consuming rows, so that loaders do not wait on the queue forever
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                rows.put(item, timeout=1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce(province):
+        try:
+            for row in _iter_province_isolated(province, **kwargs):
+                if not put(row):
+                    return
+        finally: # Even if the loader fails, so that the rows of the other provinces are still consumed
+            put(done)
+
+    def consume():
+        remaining = len(_provinces)
+        while remaining:
+            row = rows.get()
+            if row is done:
+                remaining -= 1
+            else:
+                yield row
+        for future in futures: # Errors not caught by `_iter_province_isolated` are raised once every province is done
+            future.result()
+
+    with ThreadPoolExecutor(max_workers=max_provinces or len(_provinces)) as executor:
+        futures = [executor.submit(produce, province) for province in _provinces]
+        try:
+            yield from _batched(consume(), batch_size)
+        finally:
+            stop.set()
+
+def _load_province_isolated(province, **kwargs):
+    """
+    Calls `load_province` for the given province, passing along `kwargs`. Any error is reported as a warning instead of being raised, so that one province cannot interrupt the loading of the others.
+
+    Returns: a DataFrame containing news releases from the government of the specified province or territory, or an empty DataFrame if they could not be loaded.
+    """
+    try:
+        return load_province(province, **kwargs)
+    except Exception as e:
+        warn("Could not load province \'{}\': {}".format(province, e))
+        _metrics.add(province.lower(), failures=1)
+        return pd.DataFrame([], columns=_columns)
+
+def load_provinces(start_date=None, end_date=datetime.today(), update_csv=False, verbose=False, max_workers=_max_workers, parallel=False, max_provinces=None):
     """
     Parameters: 
         - `start_date` 
@@ -903,16 +2188,33 @@ def load_provinces(start_date=None, end_date=datetime.today(), update_csv=False,
             boolean, whether or not the results from the search should be saved to a CSV. By default, this is set to False.
         - `verbose`
             boolean, whether or not the function should print updates. By default, this is set to False.
+        - `max_workers`
+            int, the maximum number of article pages each loader requests at once
+        - `parallel`
+            boolean, whether or not the provinces and territories should be loaded at the same time. Each one is saved to its CSV as soon as it finishes when `update_csv` is True. By default, this is set to False.
+        - `max_provinces`
+            int, the maximum number of provinces and territories loaded at once when `parallel` is True. By default, this is set to None, which loads all of them at once
 
     Returns: a dictionary mapping the names of provinces and territories to DataFrames containing information about their new releases.
     """
 
-    provinces = ['alberta', 'british columbia', 'manitoba', 'new brunswick', 'newfoundland', 'northwest territories', 'nova scotia', 'nunavut', 'ontario', 'pei', 'quebec', 'saskatchewan', 'yukon']
-    province_dfs = [load_province(province, start_date=start_date, end_date=end_date, update_csv=update_csv, verbose=verbose) for province in provinces]
+    kwargs = dict(start_date=start_date, end_date=end_date, update_csv=update_csv, verbose=verbose, max_workers=max_workers)
+
+    if not parallel:
+        province_dfs = [_load_province_isolated(province, **kwargs) for province in _provinces]
+        return dict(zip(_provinces, province_dfs))
+
+    province_dict = {}
+    with ThreadPoolExecutor(max_workers=max_provinces or len(_provinces)) as executor:
+        futures = {executor.submit(_load_province_isolated, province, **kwargs) : province for province in _provinces}
+        for future in as_completed(futures):
+            province = futures[future]
+            province_dict[province] = future.result()
+            if verbose: print("Finished loading {}".format(province.upper()))
 
-    return dict(zip(provinces, province_dfs))
+    return {province : province_dict[province] for province in _provinces} # Same order as the sequential mode
 
-def load_all(start_date=None, end_date=datetime.today(), update_csv=False, verbose=False):
+def load_all(start_date=None, end_date=datetime.today(), update_csv=False, verbose=False, max_workers=_max_workers, parallel=False, max_provinces=None):
     """
     Parameters: 
         - `start_date` 
@@ -923,12 +2225,18 @@ def load_all(start_date=None, end_date=datetime.today(), update_csv=False, verbo
             boolean, whether or not the results from the search should be saved to a CSV. By default, this is set to False.
         - `verbose`
             boolean, whether or not the function should print updates (False by default)
+        - `max_workers`
+            int, the maximum number of article pages each loader requests at once
+        - `parallel`
+            boolean, whether or not the provinces and territories should be loaded at the same time (False by default)
+        - `max_provinces`
+            int, the maximum number of provinces and territories loaded at once when `parallel` is True. By default, all of them are loaded at once
 
     Returns: a DataFrame containing the information from all provinces and territories.
     """
 
     full_df = pd.DataFrame([], columns=_columns)
-    province_dict = load_provinces(start_date=start_date, end_date=end_date, update_csv=update_csv, verbose=verbose)
+    province_dict = load_provinces(start_date=start_date, end_date=end_date, update_csv=update_csv, verbose=verbose, max_workers=max_workers, parallel=parallel, max_provinces=max_provinces)
     full_df = pd.concat(province_dict.values(), ignore_index=True)
     
     return full_df
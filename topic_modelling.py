@@ -6,32 +6,35 @@ import gensim
 from gensim import corpora, models
 from gensim.models.coherencemodel import CoherenceModel
 from gensim.models.ldamodel import LdaModel
+from gensim.models.ldamulticore import LdaMulticore
 from gensim.models.phrases import Phrases, Phraser
 from gensim.utils import simple_preprocess
 
-# Stopwords
-import nltk
-from nltk.corpus import stopwords
+# Stopwords (nltk is imported the first time stop words are read, since it is slow to import)
+class _LazyStopwords:
+    """
+    Stands in for `nltk.corpus.stopwords`, importing it on first use, so that `stopwords.words(lang)` works as before for this module and those importing it
+    """
+
+    def __getattr__(self, name):
+        from nltk.corpus import stopwords
+        return getattr(stopwords, name)
+
+stopwords = _LazyStopwords()
 
 # Regex
 import re
 
-# Lemmatization
-import spacy
+# Lemmatization (spacy is imported by `lemmatize`)
 # import fr_core_news_sm
 
 # Printing model topics
 from pprint import pprint
 
-# Model Visualization
-import pyLDAvis
-import pyLDAvis.gensim
-
-# For plotting coherence values
-import matplotlib.pyplot as plt
+# Model visualization (pyLDAvis) and plotting of coherence values (matplotlib) are imported on first use, since they are slow to import and not needed to apply a model
 
 # From source_scraping.py
-from source_scraping import load_province
+from source_scraping import load_province, content_hash
 
 # Dates
 from datetime import datetime
@@ -40,6 +43,13 @@ from datetime import datetime
 import numpy as np
 import pandas as pd
 from warnings import warn
+import os
+import json
+import hashlib
+import weakref
+from importlib import metadata
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 
 # Preprocessing
 
@@ -53,6 +63,7 @@ def remove_stopwords(texts, stop_words):
     
     Returns: a list of documents that does not contain any element of `stop_words`
     """
+    stop_words = frozenset(stop_words)
     return [[word for word in doc if word not in stop_words] for doc in texts]
 
 def clean_(doc):
@@ -88,7 +99,22 @@ def texts_to_words(texts):
     for doc in texts:
         yield gensim.utils.simple_preprocess(doc, deacc=True)
 
-def lemmatize(texts, allowed_postags=['NOUN', 'ADJ', 'VERB'], lang='english'):
+_spacy_pipelines = {} # spaCy pipelines already loaded in this process, by model name
+
+def spacy_pipeline(model='en_core_web_sm'):
+    """
+    Parameters:
+        - `model`
+            the name of the spaCy model to load
+
+    Returns: the spaCy pipeline for `model`, without its parser and named entity recognizer. It is only loaded the first time it is needed in each process.
+    """
+    if model not in _spacy_pipelines:
+        import spacy
+        _spacy_pipelines[model] = spacy.load(model, disable=['parser', 'ner'])
+    return _spacy_pipelines[model]
+
+def lemmatize(texts, allowed_postags=['NOUN', 'ADJ', 'VERB'], lang='english', batch_size=64, n_process=1):
     """
     Parameters:
         - `texts`
@@ -97,6 +123,10 @@ def lemmatize(texts, allowed_postags=['NOUN', 'ADJ', 'VERB'], lang='english'):
             a list of the parts of speech to be preserved (e.g ['NOUN', 'ADJ'])
         - `lang`
             the language in which the document is written
+        - `batch_size`
+            the number of documents spaCy processes together
+        - `n_process`
+            the number of processes spaCy spreads the documents across. By default, documents are processed in the current process
     
     Returns: a list of documents with words replaced by their lemmas and removed if they do not constitute a part of speech indicated in `allowed_postags`
     """
@@ -105,8 +135,20 @@ def lemmatize(texts, allowed_postags=['NOUN', 'ADJ', 'VERB'], lang='english'):
         warn('Support only currently exists for English language processing')
         return None
 
-    nlp = spacy.load('en_core_web_sm', disable=['parser', 'ner']) # if lang == 'english' else fr_core_news_sm.load(disable=['parser', 'ner'])
-    return [[token.lemma_ for token in nlp(" ".join(doc)) if token.pos_ in allowed_postags] for doc in texts]
+    nlp = spacy_pipeline('en_core_web_sm') # if lang == 'english' else fr_core_news_sm.load(disable=['parser', 'ner'])
+    allowed_postags = frozenset(allowed_postags)
+    docs = nlp.pipe((" ".join(doc) for doc in texts), batch_size=batch_size, n_process=n_process)
+    return [[token.lemma_ for token in doc if token.pos_ in allowed_postags] for doc in docs]
+
+def bigram_model(texts, min_count=5, threshold=100):
+    """
+    Parameters:
+        - `texts`
+            an iterable of documents broken into words. It is only iterated over once.
+    
+    Returns: a `Phraser` that arranges the words of a document into the bigrams found in `texts`
+    """
+    return Phraser(Phrases(texts, min_count=min_count, threshold=threshold))
 
 def make_bigrams(texts, min_count=5, threshold=100):
     """
@@ -116,18 +158,219 @@ def make_bigrams(texts, min_count=5, threshold=100):
     
     Returns: a list of documents with words arranged into bigrams where applicable
     """
-    bigram = Phrases(texts, min_count=min_count, threshold=threshold)
-    bigram_mod = Phraser(bigram)
+    bigram_mod = bigram_model(texts, min_count=min_count, threshold=threshold)
     return [bigram_mod[doc] for doc in texts]
+
+def save_phraser(phraser, model_path='models/lda'):
+    """
+    Parameters:
+        - `phraser`
+            the `Phraser` used to preprocess the texts on which an LDA model was trained
+        - `model_path`
+            the path at which the LDA model is saved. The phraser is saved next to it, at `model_path + '.phraser'`
+    """
+    phraser.save(model_path + '.phraser')
+
+def load_phraser(model_path='models/lda'):
+    """
+    Parameters:
+        - `model_path`
+            the path at which an LDA model is saved
+    
+    Returns: the `Phraser` saved next to the LDA model by `save_phraser()`, or None if there is none. It is frozen, so preprocessing new texts with it does not change the bigrams it forms.
+    """
+    path = model_path + '.phraser'
+    if not os.path.exists(path):
+        return None
+    return Phraser.load(path)
     
 # def make_trigrams(texts):
 #     return make_bigrams(make_bigrams(texts)) I'm not sure if this one behaves correctly
 
-def custom_preprocess(texts, stop_words, allowed_postags, bigrams=True, lang='english'):
+# On-disk cache of lemmatized documents, keyed by the words of each document and the lemmatization settings
+_preprocess_cache_settings = {'enabled' : True, 'directory' : '.preprocess_cache', 'max_bytes' : 256 * 2**20}
+
+def configure_preprocess_cache(enabled=True, directory='.preprocess_cache', max_bytes=256 * 2**20):
+    """
+    Parameters:
+        - `enabled`
+            a boolean indicating whether or not lemmatized documents should be saved to and read from the on-disk cache. By default, this is set to True.
+        - `directory`
+            the path of the directory in which lemmatized documents are cached
+        - `max_bytes`
+            the size past which the documents used least recently are removed from the cache
+
+    Changes how `custom_preprocess()` lemmatizes documents. Only documents missing from the cache are sent through spaCy, so that preprocessing documents again costs little.
+    """
+    _preprocess_cache_settings['enabled'] = enabled
+    _preprocess_cache_settings['directory'] = directory
+    _preprocess_cache_settings['max_bytes'] = max_bytes
+
+def _version(package):
+    """
+    Returns: the installed version of `package`, or None if it is not installed as a distribution
+    """
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+def _lemmatize_fingerprint(allowed_postags, lang, model='en_core_web_sm'):
+    """
+    Returns: a string identifying the lemmatization settings and the versions of spaCy and `model`, so that cached documents are not reused once either changes
+    """
+    settings = {'allowed_postags' : sorted(allowed_postags), 'lang' : lang, 'model' : model, 'model_version' : _version(model), 'spacy' : _version('spacy')}
+    return hashlib.sha1(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _preprocess_cache_path(doc, fingerprint):
+    """
+    Returns: the path under which the lemmas of `doc`, a list of words, are cached for the settings identified by `fingerprint`
+    """
+    key = hashlib.sha1((fingerprint + json.dumps(doc)).encode('utf-8')).hexdigest()
+    return os.path.join(_preprocess_cache_settings['directory'], key[:2], key + '.json')
+
+def _read_preprocessed(path):
+    """
+    Returns: the lemmas cached at `path`, or None if there are none. Marks them as recently used.
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            lemmas = json.load(f)
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return lemmas
+
+def _write_json(path, data):
+    """
+    Saves `data` as JSON at `path` through a temporary file, so that readers never see a partially written file
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+def _evict_preprocessed():
+    """
+    Removes the documents used least recently from the cache until it is no larger than its maximum size
+    """
+    entries = []
+    for folder, _, names in os.walk(_preprocess_cache_settings['directory']):
+        for name in names:
+            path = os.path.join(folder, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= _preprocess_cache_settings['max_bytes']:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total -= size
+
+def cached_lemmatize(texts, allowed_postags=['NOUN', 'ADJ', 'VERB'], lang='english', batch_size=64, n_process=1):
     """
     Parameters:
         - `texts`
             a list of documents broken into words
+        - `allowed_postags`
+            a list of the parts of speech to be preserved (e.g ['NOUN', 'ADJ'])
+        - `lang`
+            the language in which the document is written
+        - `batch_size`
+            the number of documents spaCy processes together
+        - `n_process`
+            the number of processes spaCy spreads the documents across
+
+    Returns: the same as `lemmatize()`. Documents lemmatized before with the same settings are read from the on-disk cache (see `configure_preprocess_cache()`), and only the others are lemmatized.
+    """
+    if lang != 'english' or not _preprocess_cache_settings['enabled']:
+        return lemmatize(texts, allowed_postags=allowed_postags, lang=lang, batch_size=batch_size, n_process=n_process)
+
+    lemmatized, written = _cached_lemmas(list(texts), _lemmatize_fingerprint(allowed_postags, lang), allowed_postags, lang, batch_size, n_process)
+    if written:
+        _evict_preprocessed()
+    return lemmatized
+
+def _cached_lemmas(texts, fingerprint, allowed_postags, lang, batch_size, n_process):
+    """
+    Returns: a tuple containing the lemmas of each document of the list `texts`, read from the cache if possible, and a boolean indicating whether or not any were added to the cache
+    """
+    paths = [_preprocess_cache_path(doc, fingerprint) for doc in texts]
+    lemmatized = [_read_preprocessed(path) for path in paths]
+
+    missing = [i for i, lemmas in enumerate(lemmatized) if lemmas is None]
+    if missing:
+        new_lemmas = lemmatize([texts[i] for i in missing], allowed_postags=allowed_postags, lang=lang, batch_size=batch_size, n_process=n_process)
+        for i, lemmas in zip(missing, new_lemmas):
+            lemmatized[i] = lemmas
+            _write_json(paths[i], lemmas)
+
+    return lemmatized, bool(missing)
+
+def iter_preprocess(texts, stop_words, allowed_postags, bigrams=True, lang='english', batch_size=64, n_process=1, phraser=None):
+    """
+    Parameters:
+        - `texts`
+            an iterable of documents
+        - `stop_words`
+            a list of words to be removed from each document in `texts`
+        - `allowed_postags`
+            a list of the parts of speech to be preserved (e.g ['NOUN', 'ADJ'])
+        - `bigrams`
+            a boolean indicating whether or not to form bigrams from the words in the texts. Unless `phraser` is given, bigrams are learned from every document in `texts`, which are read twice.
+        - `lang`
+            the language in which the texts are written
+        - `batch_size`
+            the number of documents lemmatized together (see `lemmatize()`)
+        - `n_process`
+            the number of processes across which documents are lemmatized (see `lemmatize()`)
+        - `phraser`
+            a `Phraser` forming the bigrams, e.g. the one the LDA model applied to the documents was trained with (see `load_phraser()`). By default, this is set to None, which learns bigrams from `texts`.
+
+    Sends each document through every step of `custom_preprocess()` in turn, so that only the words of one batch of `batch_size * n_process` documents are held in memory at once.
+    
+    Yields: the preprocessed documents, in the same order as `texts`
+    """
+    stop_words = frozenset(stop_words)
+    if bigrams and phraser is None:
+        if iter(texts) is texts: # Read twice, so a generator is kept in memory
+            texts = list(texts)
+        phraser = bigram_model(clean_(doc) for doc in texts_to_words(texts))
+    words = (phraser[clean_(doc)] if bigrams else clean_(doc) for doc in texts_to_words(texts))
+
+    use_cache = lang == 'english' and _preprocess_cache_settings['enabled']
+    fingerprint = _lemmatize_fingerprint(allowed_postags, lang) if use_cache else None
+    written = False
+    while True:
+        batch = list(islice(words, batch_size * n_process))
+        if not batch:
+            break
+
+        if use_cache:
+            lemmatized, batch_written = _cached_lemmas(batch, fingerprint, allowed_postags, lang, batch_size, n_process)
+            written = written or batch_written
+        else:
+            lemmatized = lemmatize(batch, allowed_postags=allowed_postags, lang=lang, batch_size=batch_size, n_process=n_process)
+
+        for doc in lemmatized:
+            yield [word for word in doc if word not in stop_words]
+
+    if written:
+        _evict_preprocessed()
+
+def custom_preprocess(texts, stop_words, allowed_postags, bigrams=True, lang='english', batch_size=64, n_process=1, phraser=None):
+    """
+    Parameters:
+        - `texts`
+            a list of documents
         - `stop_words`
             a list of words to be removed from each document in `texts`
         - `allowed_postags`
@@ -136,14 +379,17 @@ def custom_preprocess(texts, stop_words, allowed_postags, bigrams=True, lang='en
             a boolean indicating whether or not to form bigrams from the words in the texts
         - `lang`
             the language in which the texts are written
+        - `batch_size`
+            the number of documents lemmatized together (see `lemmatize()`)
+        - `n_process`
+            the number of processes across which documents are lemmatized (see `lemmatize()`)
+        - `phraser`
+            a prebuilt `Phraser` forming the bigrams (see `load_phraser()`). By default, this is set to None, which learns bigrams from `texts`.
 
     
-    Returns: a list of preprocessed documents. A result of calling the functions `text_to_words()`, `clean()`, (optionally) `make_bigrams()`, and `lemmatize()` in succession.
+    Returns: a list of preprocessed documents. A result of calling the functions `text_to_words()`, `clean()`, (optionally) `make_bigrams()`, `lemmatize()` and `remove_stopwords()` in succession, one batch of documents at a time (see `iter_preprocess()`). Lemmas are read from the on-disk cache for documents that were preprocessed before (see `cached_lemmatize()`).
     """
-    words = list(texts_to_words(texts))
-    cleaned_words = clean(words)
-    optional_bigrams = make_bigrams(cleaned_words) if bigrams else cleaned_words # Bigrams only if indicated
-    return remove_stopwords(lemmatize(optional_bigrams, allowed_postags=allowed_postags, lang=lang), stop_words)
+    return list(iter_preprocess(texts, stop_words, allowed_postags, bigrams=bigrams, lang=lang, batch_size=batch_size, n_process=n_process, phraser=phraser))
 
 def form_corpus(texts, id2word):
     return [id2word.doc2bow(text) for text in texts]
@@ -152,17 +398,269 @@ def dict_corpus(texts):
     """
     Parameters:
         - `texts`
-            a list of documents broken into words
+            a list of documents broken into words, or documents saved on disk by `preprocess_corpus()`
     
-    Returns: a dictionary and corpus for use in LDA models
+    Returns: a dictionary and corpus for use in LDA models. For documents saved on disk, the corpus is saved next to them in the Matrix Market format, and read from disk one document at a time. Its files are removed once the corpus is no longer used.
     """
     id2word = corpora.Dictionary(texts)
+    if isinstance(texts, _TextsFile):
+        corpus_path = texts.path[:-len('.jsonl')] + '.mm'
+        corpora.MmCorpus.serialize(corpus_path, (id2word.doc2bow(text) for text in texts))
+        corpus = corpora.MmCorpus(corpus_path)
+        weakref.finalize(corpus, _remove_files, os.getpid(), corpus_path, corpus_path + '.index')
+        return id2word, corpus
+
     corpus = form_corpus(texts, id2word)
     return id2word, corpus
 
+# Out-of-core corpora, for documents that do not fit in memory
+_corpus_settings = {'memory_budget' : 2**30, 'directory' : '.corpus'}
+_bytes_per_word = 160 # Approximate memory taken by a word of a preprocessed document held in a list, and by its entry in a bag-of-words corpus
+
+def configure_corpus(memory_budget=2**30, directory='.corpus'):
+    """
+    Parameters:
+        - `memory_budget`
+            the number of bytes of memory that preprocessed documents and their bag-of-words corpus may take. Past it, `preprocess_corpus()` saves them on disk instead. None never saves them on disk.
+        - `directory`
+            the path of the directory in which documents and corpora are saved when they do not fit in memory
+
+    Changes how `lda_from_list()` holds the documents it trains models on. Documents saved on disk are read back a chunk at a time by training, log perplexity and coherence, so that the number of documents is not limited by memory. Models trained from disk are the same as those trained from memory.
+    """
+    _corpus_settings['memory_budget'] = memory_budget
+    _corpus_settings['directory'] = directory
+
+def _remove_files(pid, *paths):
+    """
+    Removes the files at the given paths that still exist, if called from the process `pid` that created them rather than from a process forked from it
+    """
+    if os.getpid() != pid:
+        return
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+class _TextsFile:
+    """
+    Documents broken into words, saved one per line as JSON at `path`. Can be iterated over several times, reading one document at a time. The file is removed once the object is no longer used, or when the process exits.
+    """
+
+    def __init__(self, path, length):
+        self.path = path
+        self.length = length
+        weakref.finalize(self, _remove_files, os.getpid(), path)
+
+    def __iter__(self):
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+
+    def __len__(self):
+        return self.length
+
+def preprocess_corpus(texts, stop_words, allowed_postags, bigrams=True, lang='english', phraser=None):
+    """
+    Parameters:
+        - `texts`
+            an iterable of documents
+        - `stop_words`
+            a list of words to be removed from each document in `texts`
+        - `allowed_postags`
+            a list of the parts of speech to be preserved (e.g ['NOUN', 'ADJ'])
+        - `bigrams`
+            a boolean indicating whether or not to form bigrams from the words in the texts
+        - `lang`
+            the language in which the texts are written
+        - `phraser`
+            a prebuilt `Phraser` forming the bigrams (see `custom_preprocess()`)
+
+    Preprocesses documents as `custom_preprocess()` does. Once they would take more memory than the budget set by `configure_corpus()`, they are written to a file in its directory as they are preprocessed. The file is removed once the returned documents are no longer used.
+    
+    Returns: a list of preprocessed documents if they fit within the memory budget, or else an iterable reading them from disk one at a time
+    """
+    docs = iter_preprocess(texts, stop_words, allowed_postags, bigrams=bigrams, lang=lang, phraser=phraser)
+    memory_budget = _corpus_settings['memory_budget']
+    processed = []
+    size = 0
+    for doc in docs:
+        processed.append(doc)
+        size += _bytes_per_word * (len(doc) + 1)
+        if memory_budget is not None and size > memory_budget:
+            break
+    else:
+        return processed
+
+    os.makedirs(_corpus_settings['directory'], exist_ok=True)
+    path = os.path.join(_corpus_settings['directory'], 'corpus-{}-{}.jsonl'.format(os.getpid(), datetime.now().strftime('%Y%m%d%H%M%S%f')))
+    length = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for doc in processed:
+            f.write(json.dumps(doc) + '\n')
+        length += len(processed)
+        processed = None
+        for doc in docs:
+            f.write(json.dumps(doc) + '\n')
+            length += 1
+    return _TextsFile(path, length)
+
+# Topic inference
+
+def document_topics(lda_model, corpus, chunksize=2000, minimum_probability=None, sparse=False):
+    """
+    Parameters:
+        - `lda_model`
+            a gensim LDA model
+        - `corpus`
+            an iterable of documents in bag-of-words format, e.g. the result of `form_corpus()`
+        - `chunksize`
+            the number of documents whose topics are inferred at once
+        - `minimum_probability`
+            the probability below which a topic is given a weight of 0 in a document. By default, the model's own minimum probability is used, as in `get_document_topics()`.
+        - `sparse`
+            a boolean specifying whether to return a `scipy.sparse` CSR matrix instead of a dense NumPy array
+
+    Infers the topic distribution of every document with a single call to the model's variational inference per chunk, instead of one call to `get_document_topics()` per document.
+    
+    Returns: a matrix with one row per document and one column per topic, containing the same weights as `get_document_topics()` would give
+    """
+    if minimum_probability is None:
+        minimum_probability = lda_model.minimum_probability
+    minimum_probability = max(minimum_probability, 1e-8)
+
+    corpus = iter(corpus)
+    rows = []
+    while True:
+        chunk = list(islice(corpus, chunksize))
+        if not chunk:
+            break
+        gamma, _ = lda_model.inference(chunk)
+        totals = np.cumsum(gamma, axis=1, dtype=np.float64)[:, -1:] # Summed in order and in double precision, then divided in the model's precision, as `get_document_topics()` does, so that weights are the same
+        topics = gamma / totals.astype(gamma.dtype)
+        topics[topics < minimum_probability] = 0
+        rows.append(topics.astype(np.float64))
+
+    matrix = np.vstack(rows) if rows else np.zeros((0, lda_model.num_topics))
+    if sparse:
+        from scipy.sparse import csr_matrix
+        return csr_matrix(matrix)
+    return matrix
+
 # Tuning num_topics hyperparameter
 
-def find_best_model_log_perp(n_topic_range, texts, id2word, corpus, threshold=None, random_state=42, plot=True, verbose=False):
+def _plot(n_topic_range, values):
+    """
+    Plots the metric values obtained against each `num_topics` value in `n_topic_range`
+    """
+    import matplotlib.pyplot as plt
+    plt.plot(n_topic_range, values, 'b')
+    plt.show()
+
+def _train_lda(corpus, id2word, n_topics, random_state, workers=None, passes=10):
+    """
+    Returns: a gensim LDA model with `n_topics` topics trained on `corpus` for `passes` passes, with `LdaMulticore` across `workers` processes if given
+    """
+    if workers is None:
+        return LdaModel(corpus=corpus,
+                        id2word=id2word,
+                        num_topics=n_topics,
+                        random_state=random_state,
+                        update_every=1,
+                        chunksize=100,
+                        passes=passes,
+                        alpha='auto',
+                        per_word_topics=True
+                        )
+
+    return LdaMulticore(corpus=corpus, # LdaMulticore cannot learn `alpha`, so it keeps the default symmetric prior
+                        id2word=id2word,
+                        num_topics=n_topics,
+                        random_state=random_state,
+                        chunksize=100,
+                        passes=passes,
+                        per_word_topics=True,
+                        workers=workers
+                        )
+
+def _score_candidate(n_topics, corpus, id2word, metric, random_state, workers=None):
+    """
+    Returns: a tuple containing an LDA model with `n_topics` topics and its `metric` value, either 'log_perplexity' or None for no value
+    """
+    lda_model = _train_lda(corpus, id2word, n_topics, random_state, workers=workers)
+    if metric == 'log_perplexity':
+        return lda_model, lda_model.log_perplexity(corpus)
+    return lda_model, None
+
+def _coherence_values(models, texts, id2word, topn=20):
+    """
+    Returns: the C_v coherence value of each of the given LDA models, the same as a `CoherenceModel` of each would give. Word co-occurrences are counted in a single pass over `texts`, for the top `topn` words of every topic of every model, and shared by all of them.
+    """
+    co_model = CoherenceModel.for_models(models, id2word, topn=topn, texts=texts, coherence='c_v')
+    coherences = []
+    for lda_model in models:
+        co_model.topics = CoherenceModel.top_topics_as_word_lists(lda_model, id2word, topn=topn)
+        coherences.append(co_model.get_coherence())
+    return coherences
+
+_search_data = {} # The corpus searched by the current process, when it is one of the processes of a parallel search
+
+def _init_search(corpus, id2word):
+    _search_data.update(corpus=corpus, id2word=id2word)
+
+def _score_in_search(n_topics, metric, random_state, workers):
+    """
+    Returns: the same as `_score_candidate()`, for the corpus of the parallel search this process belongs to
+    """
+    return _score_candidate(n_topics, _search_data['corpus'], _search_data['id2word'], metric, random_state, workers=workers)
+
+def _continue_training(n_topics, lda_model, passes, corpus, id2word, random_state, workers=None):
+    """
+    Returns: `lda_model` after `passes` more passes over `corpus`, or a new model with `n_topics` topics trained for `passes` passes if `lda_model` is None
+    """
+    if lda_model is None:
+        return _train_lda(corpus, id2word, n_topics, random_state, workers=workers, passes=passes)
+    lda_model.update(corpus, passes=passes)
+    return lda_model
+
+def _continue_in_search(n_topics, lda_model, passes, random_state, workers):
+    """
+    Returns: the same as `_continue_training()`, for the corpus of the parallel search this process belongs to
+    """
+    return _continue_training(n_topics, lda_model, passes, _search_data['corpus'], _search_data['id2word'], random_state, workers=workers)
+
+def _search_candidates(n_topic_range, id2word, corpus, metric, random_state, n_jobs=None, workers=None):
+    """
+    Yields: a tuple containing the `num_topics` value, the LDA model and its `metric` value of each candidate in `n_topic_range`, in order. With `n_jobs`, candidates are trained in that many processes at once, and those not yet started are cancelled once iteration stops.
+    """
+    if n_jobs is None or n_jobs == 1:
+        for n_topics in n_topic_range:
+            lda_model, value = _score_candidate(n_topics, corpus, id2word, metric, random_state, workers=workers)
+            yield n_topics, lda_model, value
+        return
+
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_search, initargs=(corpus, id2word)) as executor:
+        futures = [executor.submit(_score_in_search, n_topics, metric, random_state, workers) for n_topics in n_topic_range]
+        try:
+            for n_topics, future in zip(n_topic_range, futures):
+                lda_model, value = future.result()
+                yield n_topics, lda_model, value
+        finally:
+            for future in futures:
+                future.cancel()
+
+def _continue_candidates(tasks, id2word, corpus, random_state, n_jobs=None, workers=None):
+    """
+    Returns: the list of models resulting from `_continue_training()` for each (`n_topics`, `lda_model`, `passes`) tuple in `tasks`, trained in `n_jobs` processes at once if given
+    """
+    if n_jobs is None or n_jobs == 1:
+        return [_continue_training(n_topics, lda_model, passes, corpus, id2word, random_state, workers=workers) for n_topics, lda_model, passes in tasks]
+
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_search, initargs=(corpus, id2word)) as executor:
+        futures = [executor.submit(_continue_in_search, n_topics, lda_model, passes, random_state, workers) for n_topics, lda_model, passes in tasks]
+        return [future.result() for future in futures]
+
+def find_best_model_log_perp(n_topic_range, texts, id2word, corpus, threshold=None, random_state=42, plot=True, verbose=False, n_jobs=None, workers=None):
     """
     Searches for the best model in a given range by log perplexity value
 
@@ -183,6 +681,10 @@ def find_best_model_log_perp(n_topic_range, texts, id2word, corpus, threshold=No
         a boolean specifying whether or not to plot log perplexity values against each `num_topics` value
     - `verbose`
         a boolean specifying whether or not to print updates
+    - `n_jobs`
+        the number of processes across which candidate models are trained at once. By default, this is set to None, which trains them one after another in the current process. The models and values are the same either way.
+    - `workers`
+        the number of processes each model is trained across, with `LdaMulticore`. By default, this is set to None, which trains each model with `LdaModel`. Since `LdaMulticore` cannot learn the `alpha` prior, the models differ from those trained by `LdaModel`.
 
     Returns: a tuple containing the best model, the list of all models attempted, and a list of all log perplexity values obtained, respectively.
     """
@@ -190,49 +692,34 @@ def find_best_model_log_perp(n_topic_range, texts, id2word, corpus, threshold=No
     models = []
     perp_vals = []
 
-    for n_topics in n_topic_range:
+    for n_topics, lda_model, p in _search_candidates(n_topic_range, id2word, corpus, 'log_perplexity', random_state, n_jobs=n_jobs, workers=workers):
 
         # Print percentage progress
         if verbose:
             diff = max(n_topic_range) - n_topic_range.start
             print(str(round(100 * (n_topics - n_topic_range.start) / diff, 1)) + "% done")
-
-        lda_model = LdaModel(corpus=corpus,
-                            id2word=id2word,
-                            num_topics=n_topics,
-                            random_state=random_state,
-                            update_every=1,
-                            chunksize=100,
-                            passes=10,
-                            alpha='auto',
-                            per_word_topics=True
-                            )
-
-        p = lda_model.log_perplexity(corpus)
                         
         models.append(lda_model)
         perp_vals.append(p)
 
-    if threshold is not None and p < threshold:
-        if verbose: 
-            print('Returning early with a log perplexity value of ' + str(p))
+        if threshold is not None and p < threshold:
+            if verbose: 
+                print('Returning early with a log perplexity value of ' + str(p))
 
-        if plot:
-            actual_range = range(n_topic_range.start, n_topics + n_topic_range.step, n_topic_range.step)
-            plt.plot(actual_range, perp_vals, 'b')
-            plt.show()
+            if plot:
+                actual_range = range(n_topic_range.start, n_topics + n_topic_range.step, n_topic_range.step)
+                _plot(actual_range, perp_vals)
 
-        return lda_model, models, perp_vals
+            return lda_model, models, perp_vals
 
 
     if plot:
         # The portion of the range that was actually iterated through
-        plt.plot(n_topic_range, perp_vals, 'b')
-        plt.show()
+        _plot(n_topic_range, perp_vals)
     
     return models[np.argmin(perp_vals)], models, perp_vals
 
-def find_best_model_cv(n_topic_range, texts, id2word, corpus, threshold=None, random_state=42, plot=True, verbose=False):
+def find_best_model_cv(n_topic_range, texts, id2word, corpus, threshold=None, random_state=42, plot=True, verbose=False, n_jobs=None, workers=None):
     """
     Searches for the best model in a given range by C_v coherence value
 
@@ -253,54 +740,147 @@ def find_best_model_cv(n_topic_range, texts, id2word, corpus, threshold=None, ra
             a boolean specifying whether or not to plot coherence values against each `num_topics` value
         - `verbose`
             a boolean specifying whether or not to print updates
+        - `n_jobs`
+            the number of processes across which candidate models are trained at once. By default, this is set to None, which trains them one after another in the current process. The models and values are the same either way.
+        - `workers`
+            the number of processes each model is trained across, with `LdaMulticore`. By default, this is set to None, which trains each model with `LdaModel`. Since `LdaMulticore` cannot learn the `alpha` prior, the models differ from those trained by `LdaModel`.
     
     Returns: a tuple containing the best model, the list of all models attempted, and a list of all coherence values obtained, respectively.
     """
     models = []
     coherence_vals = []
+
+    # Candidates are scored in groups, sharing the word co-occurrences counted in `texts`. Without a threshold, every candidate is trained before any is scored, so `texts` are only read once.
+    group_size = max(len(n_topic_range), 1) if threshold is None else (n_jobs or 1)
+    for start in range(0, len(n_topic_range), group_size):
+        group_range = n_topic_range[start:start + group_size]
+        group_models = [lda_model for _, lda_model, _ in _search_candidates(group_range, id2word, corpus, None, random_state, n_jobs=n_jobs, workers=workers)]
         
-    for n_topics in n_topic_range:
+        for n_topics, lda_model, coherence in zip(group_range, group_models, _coherence_values(group_models, texts, id2word)):
         
-        # Print percentage progress
-        if verbose:
-            diff = max(n_topic_range) - n_topic_range.start
-            print(str(round(100 * (n_topics - n_topic_range.start) / diff, 1)) + "% done")
-        
-        lda_model = LdaModel(corpus=corpus,
-                            id2word=id2word,
-                            num_topics=n_topics,
-                            random_state=random_state,
-                            update_every=1,
-                            chunksize=100,
-                            passes=10,
-                            alpha='auto',
-                            per_word_topics=True
-                            )
-        co_model = CoherenceModel(lda_model, texts=texts, dictionary=id2word, coherence="c_v")
-        coherence = co_model.get_coherence()
+            # Print percentage progress
+            if verbose:
+                diff = max(n_topic_range) - n_topic_range.start
+                print(str(round(100 * (n_topics - n_topic_range.start) / diff, 1)) + "% done")
                 
-        models.append(lda_model)
-        coherence_vals.append(coherence)
+            models.append(lda_model)
+            coherence_vals.append(coherence)
 
-        if threshold is not None and coherence > threshold:
-            if verbose: 
-                print('Returning early with a coherence value of ' + str(coherence))
+            if threshold is not None and coherence > threshold:
+                if verbose: 
+                    print('Returning early with a coherence value of ' + str(coherence))
 
-            if plot:
-                actual_range = range(n_topic_range.start, n_topics + n_topic_range.step, n_topic_range.step)
-                plt.plot(actual_range, coherence_vals, 'b')
-                plt.show()
+                if plot:
+                    actual_range = range(n_topic_range.start, n_topics + n_topic_range.step, n_topic_range.step)
+                    _plot(actual_range, coherence_vals)
 
-            return lda_model, models, coherence_vals
+                return lda_model, models, coherence_vals
 
 
     if plot:
         # The portion of the range that was actually iterated through
-        plt.plot(n_topic_range, coherence_vals, 'b')
-        plt.show()
+        _plot(n_topic_range, coherence_vals)
     
     return models[np.argmax(coherence_vals)], models, coherence_vals
 
+def find_best_model_halving(n_topic_range, texts, id2word, corpus, use_coherence=True, min_passes=2, max_passes=10, reduction=3, budget=None, random_state=42, plot=True, verbose=False, n_jobs=None, workers=None):
+    """
+    Searches for the best model in a given range by successive halving. Every candidate is trained for `min_passes` passes and scored, then only the best `1 / reduction` of them are trained further, for `reduction` times as many passes in total, until the remaining candidates reach `max_passes` passes.
+
+    Parameters:
+        - `n_topic_range`
+            a range of values for the `num_topics` parameter of a gensim LDA model to try
+        - `texts`
+            a list of documents broken into words
+        - `id2word`
+            a dictionary containing word encodings
+        - `corpus`
+            the result of mapping each word in `texts` to its value in `id2word`
+        - `use_coherence`
+            a boolean specifying whether to compare candidates by C_v coherence, as `find_best_model_cv()` does. When False, they are compared by log perplexity, as `find_best_model_log_perp()` does.
+        - `min_passes`
+            the number of passes over `corpus` for which every candidate is trained, at least 1
+        - `max_passes`
+            the number of passes over `corpus` for which the remaining candidates are trained in the end, at least `min_passes`
+        - `reduction`
+            the integer factor, greater than 1, by which the number of candidates is reduced, and their number of passes increased, at each step
+        - `budget`
+            the largest number of passes over `corpus` made across all candidates, which must be at least `min_passes`. Fewer candidates are trained further once it would be exceeded. If it cannot train every candidate for `min_passes` passes, the candidates trained are spread evenly across `n_topic_range`. By default, this is set to None, which only follows the schedule above. The exhaustive search of `find_best_model_cv()` makes `len(n_topic_range) * 10` passes.
+        - `random_state` 
+            a random state for use in a gensim LDA model
+        - `plot`
+            a boolean specifying whether or not to plot the last value of each candidate against each `num_topics` value
+        - `verbose`
+            a boolean specifying whether or not to print updates
+        - `n_jobs`
+            the number of processes across which candidate models are trained at once (see `find_best_model_cv()`)
+        - `workers`
+            the number of processes each model is trained across, with `LdaMulticore` (see `find_best_model_cv()`)
+    
+    Returns: a tuple containing the best model, the list of all models attempted, and a list of the last coherence (or log perplexity, see `use_coherence`) value obtained by each, respectively. Models that were not trained further only had `min_passes` passes.
+    """
+    if not isinstance(reduction, (int, np.integer)) or reduction <= 1:
+        raise ValueError('reduction must be an integer greater than 1, not {}'.format(reduction))
+    if not 1 <= min_passes <= max_passes:
+        raise ValueError('min_passes and max_passes must satisfy 1 <= min_passes <= max_passes, not {} and {}'.format(min_passes, max_passes))
+    if budget is not None and budget < min_passes:
+        raise ValueError('A budget of {} passes cannot train any candidate for {} passes'.format(budget, min_passes))
+
+    n_topic_range = list(n_topic_range)
+    models = [None] * len(n_topic_range)
+    values = [None] * len(n_topic_range)
+    passes = [0] * len(n_topic_range)
+    remaining = list(range(len(n_topic_range))) # Indices of the candidates still being trained
+    target_passes = min_passes
+    spent = 0
+
+    while remaining:
+        # Candidates the budget can still afford to train up to `target_passes`
+        if budget is not None:
+            affordable = max((budget - spent) // (target_passes - passes[remaining[0]]), 0)
+            if affordable < len(remaining) and spent == 0: # None has been scored yet, so they are spread evenly across the range
+                step = (len(remaining) - 1) / max(affordable - 1, 1)
+                remaining = [remaining[round(k * step)] for k in range(affordable)] if affordable > 1 else [remaining[len(remaining) // 2]]
+            else: # Sorted best first after each step
+                remaining = remaining[:affordable]
+            if not remaining:
+                break
+
+        if verbose:
+            print('Training {} candidates up to {} passes'.format(len(remaining), target_passes))
+
+        tasks = [(n_topic_range[i], models[i], target_passes - passes[i]) for i in remaining]
+        for i, lda_model in zip(remaining, _continue_candidates(tasks, id2word, corpus, random_state, n_jobs=n_jobs, workers=workers)):
+            spent += target_passes - passes[i]
+            models[i], passes[i] = lda_model, target_passes
+
+        if use_coherence:
+            scores = _coherence_values([models[i] for i in remaining], texts, id2word)
+        else:
+            scores = [models[i].log_perplexity(corpus) for i in remaining]
+        for i, value in zip(remaining, scores):
+            values[i] = value
+
+        if target_passes >= max_passes:
+            break
+
+        # Keep the best candidates, highest coherence or lowest log perplexity first
+        remaining = sorted(remaining, key=lambda i: -values[i] if use_coherence else values[i])
+        remaining = remaining[:max(len(remaining) // reduction, 1)]
+        target_passes = min(target_passes * reduction, max_passes)
+
+    trained = [i for i in range(len(n_topic_range)) if models[i] is not None]
+    finalists = [i for i in trained if passes[i] == max(passes)]
+    best = max(finalists, key=lambda i: values[i] if use_coherence else -values[i])
+
+    if verbose:
+        print('Made {} passes over the corpus, choosing {} topics'.format(spent, n_topic_range[best]))
+
+    if plot:
+        _plot([n_topic_range[i] for i in trained], [values[i] for i in trained])
+
+    return models[best], [models[i] for i in trained], [values[i] for i in trained]
+
 # Model visualization
 
 def visualize_model(model, corpus, id2word):
@@ -315,12 +895,15 @@ def visualize_model(model, corpus, id2word):
     
     Returns: a pyLDAvis visualization
     """
+    import pyLDAvis
+    import pyLDAvis.gensim
+
     pyLDAvis.enable_notebook()
     return pyLDAvis.gensim.prepare(model, corpus, id2word, mds='mmds')
 
 # Pipeline for creation of an LDA model
 
-def lda_from_list(ls, lang='english', bigram=True, allowed_postags=['NOUN', 'VERB', 'ADJ'], stopword_extensions=[], n_topic_range=range(2, 40, 3), threshold=None, use_coherence=True, random_state=42, plot=True, verbose=False):
+def lda_from_list(ls, lang='english', bigram=True, allowed_postags=['NOUN', 'VERB', 'ADJ'], stopword_extensions=[], n_topic_range=range(2, 40, 3), threshold=None, use_coherence=True, random_state=42, plot=True, verbose=False, n_jobs=None, workers=None, search='grid', budget=None):
     """
     Parameters:
     - `list`
@@ -345,31 +928,55 @@ def lda_from_list(ls, lang='english', bigram=True, allowed_postags=['NOUN', 'VER
         a boolean specifying whether or not to plot coherence (or log perplexity, see `use_coherence`) values against each `num_topics` value
     - `verbose`
         a boolean specifying whether or not to print updates
+    - `n_jobs`
+        the number of processes across which candidate models are trained at once (see `find_best_model_cv()`)
+    - `workers`
+        the number of processes each candidate model is trained across, with `LdaMulticore` (see `find_best_model_cv()`)
+    - `search`
+        how the best `num_topics` value is searched for. With 'grid', every candidate is fully trained (see `find_best_model_cv()`). With 'halving', only the most promising candidates are (see `find_best_model_halving()`), and `threshold` is not used.
+    - `budget`
+        the largest number of passes over the corpus made across all candidates when `search` is 'halving' (see `find_best_model_halving()`)
     
     Returns:
-        a dictionary containing the best model, full model list, list of coherence values, the id2word dictionary, corpus, and texts
+        a dictionary containing the best model, full model list, list of coherence values, the id2word dictionary, corpus, texts, and the phraser that formed bigrams (None if `bigram` is False). The corpus and texts are read from disk if they did not fit in the memory budget (see `configure_corpus()`). The phraser should be saved with the model (see `save_phraser()`)
     """
     
-    find_best_model = find_best_model_cv if use_coherence else find_best_model_log_perp
     texts = ls
     
     if verbose: print("\nPreprocessing Texts\n")
     
     stop_words = stopwords.words(lang)
     stop_words.extend(stopword_extensions)
-    texts = custom_preprocess(texts, allowed_postags=allowed_postags, stop_words=stop_words, bigrams=True, lang=lang)
+    phraser = bigram_model(clean_(doc) for doc in texts_to_words(texts)) if bigram else None
+    texts = preprocess_corpus(texts, allowed_postags=allowed_postags, stop_words=stop_words, bigrams=bigram, lang=lang, phraser=phraser)
     
     id2word, corpus = dict_corpus(texts)
     
     if verbose: print("\nFinding Best n_topics Values\n")
-    model, model_list, co_vals = find_best_model(n_topic_range=n_topic_range, 
-        texts=texts, 
-        id2word=id2word, 
-        corpus=corpus, 
-        random_state=random_state, 
-        threshold=threshold, 
-        plot=plot, 
-        verbose=verbose)
+    if search == 'halving':
+        model, model_list, co_vals = find_best_model_halving(n_topic_range=n_topic_range, 
+            texts=texts, 
+            id2word=id2word, 
+            corpus=corpus, 
+            use_coherence=use_coherence,
+            budget=budget,
+            random_state=random_state, 
+            plot=plot, 
+            verbose=verbose,
+            n_jobs=n_jobs,
+            workers=workers)
+    else:
+        find_best_model = find_best_model_cv if use_coherence else find_best_model_log_perp
+        model, model_list, co_vals = find_best_model(n_topic_range=n_topic_range, 
+            texts=texts, 
+            id2word=id2word, 
+            corpus=corpus, 
+            random_state=random_state, 
+            threshold=threshold, 
+            plot=plot, 
+            verbose=verbose,
+            n_jobs=n_jobs,
+            workers=workers)
     
     return {
         'best_model' : model, 
@@ -377,10 +984,11 @@ def lda_from_list(ls, lang='english', bigram=True, allowed_postags=['NOUN', 'VER
         'coherence_vals' : co_vals, 
         'id2word' : id2word, 
         'corpus' : corpus,
-        'texts' : texts
+        'texts' : texts,
+        'phraser' : phraser
     }
 
-def lda_from_df(df, doc_attrib='source_full_text', lang='english', bigram=True, allowed_postags=['NOUN', 'VERB', 'ADJ'], stopword_extensions=[], n_topic_range=range(2, 40, 3), threshold=None, use_coherence=True, random_state=42, plot=True, verbose=False):
+def lda_from_df(df, doc_attrib='source_full_text', lang='english', bigram=True, allowed_postags=['NOUN', 'VERB', 'ADJ'], stopword_extensions=[], n_topic_range=range(2, 40, 3), threshold=None, use_coherence=True, random_state=42, plot=True, verbose=False, n_jobs=None, workers=None, search='grid', budget=None):
     """
     Parameters:
     - `df`
@@ -407,6 +1015,14 @@ def lda_from_df(df, doc_attrib='source_full_text', lang='english', bigram=True,
         a boolean specifying whether or not to plot coherence (or log perplexity, see `use_coherence`) values against each `num_topics` value
     - `verbose`
         a boolean specifying whether or not to print updates
+    - `n_jobs`
+        the number of processes across which candidate models are trained at once (see `find_best_model_cv()`)
+    - `workers`
+        the number of processes each candidate model is trained across, with `LdaMulticore` (see `find_best_model_cv()`)
+    - `search`
+        how the best `num_topics` value is searched for. With 'grid', every candidate is fully trained (see `find_best_model_cv()`). With 'halving', only the most promising candidates are (see `find_best_model_halving()`), and `threshold` is not used.
+    - `budget`
+        the largest number of passes over the corpus made across all candidates when `search` is 'halving' (see `find_best_model_halving()`)
     
     Returns:
         a dictionary containing the best model, full model list, list of coherence values, the id2word dictionary, corpus, and texts
@@ -422,9 +1038,13 @@ def lda_from_df(df, doc_attrib='source_full_text', lang='english', bigram=True,
         use_coherence=use_coherence,
         random_state=random_state,
         plot=plot,
-        verbose=verbose)
+        verbose=verbose,
+        n_jobs=n_jobs,
+        workers=workers,
+        search=search,
+        budget=budget)
 
-def lda_from_province(province, doc_attrib='source_full_text', start_date=datetime(2020, 1, 1), end_date=datetime.today(), bigram=True, allowed_postags=['NOUN', 'VERB', 'ADJ'], stopword_extensions=[], n_topic_range=range(2, 40, 3), threshold=None, use_coherence=True, random_state=42, plot=True, verbose=False):
+def lda_from_province(province, doc_attrib='source_full_text', start_date=datetime(2020, 1, 1), end_date=datetime.today(), bigram=True, allowed_postags=['NOUN', 'VERB', 'ADJ'], stopword_extensions=[], n_topic_range=range(2, 40, 3), threshold=None, use_coherence=True, random_state=42, plot=True, verbose=False, n_jobs=None, workers=None, search='grid', budget=None):
     """
     Parameters:
     - `province`
@@ -453,6 +1073,14 @@ def lda_from_province(province, doc_attrib='source_full_text', start_date=dateti
         a boolean specifying whether or not to plot coherence (or log perplexity, see `use_coherence`) values against each `num_topics` value
     - `verbose`
         a boolean specifying whether or not to print updates
+    - `n_jobs`
+        the number of processes across which candidate models are trained at once (see `find_best_model_cv()`)
+    - `workers`
+        the number of processes each candidate model is trained across, with `LdaMulticore` (see `find_best_model_cv()`)
+    - `search`
+        how the best `num_topics` value is searched for. With 'grid', every candidate is fully trained (see `find_best_model_cv()`). With 'halving', only the most promising candidates are (see `find_best_model_halving()`), and `threshold` is not used.
+    - `budget`
+        the largest number of passes over the corpus made across all candidates when `search` is 'halving' (see `find_best_model_halving()`)
     
     Returns:
         a dictionary containing the best model, full model list, list of coherence values, the id2word dictionary, corpus, and texts
@@ -477,4 +1105,180 @@ def lda_from_province(province, doc_attrib='source_full_text', start_date=dateti
         use_coherence=use_coherence,
         random_state=random_state,
         plot=plot,  
-        verbose=verbose)
+        verbose=verbose,
+        n_jobs=n_jobs,
+        workers=workers,
+        search=search,
+        budget=budget)
+
+# Incremental updates of a saved LDA model
+
+def model_metadata(model_path='models/lda'):
+    """
+    Parameters:
+        - `model_path`
+            the path at which an LDA model is saved
+    
+    Returns: a dictionary describing the saved model: its `version`, incremented by each update, when it was last `updated`, the number of `documents` it has seen, its `num_terms` and `num_topics`, and the list of `updates` made to it. Models saved without metadata are given version 1.
+    """
+    try:
+        with open(model_path + '.meta.json', encoding='utf-8') as f:
+            return json.load(f)
+    except OSError:
+        return {'version' : 1, 'updated' : None, 'documents' : None, 'num_terms' : None, 'num_topics' : None, 'updates' : []}
+
+def save_lda(lda_model, model_path='models/lda', phraser=None, texts=None):
+    """
+    Parameters:
+        - `lda_model`
+            a gensim LDA model, e.g. the best model returned by `lda_from_df()`
+        - `model_path`
+            the path at which the model is saved
+        - `phraser`
+            the `Phraser` used to preprocess the texts the model was trained on, saved next to it (see `save_phraser()`)
+        - `texts`
+            the documents the model was trained on, before preprocessing, e.g. the full texts of the articles passed to `lda_from_df()`. Their content hashes are saved next to the model, so that `update_lda()` does not fold them in again.
+
+    Saves a newly trained model, as version 1, replacing any model previously saved at `model_path` along with its metadata, update history and the content hashes of the documents it was trained on.
+    """
+    lda_model.save(model_path)
+    if phraser is not None:
+        save_phraser(phraser, model_path)
+
+    hashes = dict.fromkeys(text_hash for text_hash in map(content_hash, texts if texts is not None else []) if text_hash is not None) # In order, without duplicates
+    with open(model_path + '.hashes.txt', 'w', encoding='utf-8') as f:
+        f.write(''.join(text_hash + '\n' for text_hash in hashes))
+
+    metadata = {'version' : 1, 'updated' : datetime.now().isoformat(), 'documents' : lda_model.id2word.num_docs,
+                'num_terms' : lda_model.num_terms, 'num_topics' : lda_model.num_topics, 'updates' : []}
+    _write_json(model_path + '.meta.json', metadata)
+
+def _resize_topics(lda_model, kept_ids, new_terms=0):
+    """
+    Keeps the topic-word statistics of the terms in `kept_ids`, in that order, and appends statistics for `new_terms` new terms, drawn as gensim draws those of a new model. The model's `id2word` should already have been changed accordingly.
+    """
+    sstats = lda_model.state.sstats[:, kept_ids]
+    eta = lda_model.eta[kept_ids]
+    if new_terms:
+        sstats = np.hstack([sstats, lda_model.random_state.gamma(100., 1. / 100., (lda_model.num_topics, new_terms)).astype(sstats.dtype)])
+        eta = np.concatenate([eta, np.full(new_terms, lda_model.eta.mean(), dtype=eta.dtype)])
+
+    lda_model.state.sstats = sstats
+    lda_model.state.eta = eta
+    lda_model.eta = eta
+    lda_model.num_terms = sstats.shape[1]
+    lda_model.sync_state()
+
+def _grow_vocabulary(lda_model, texts, min_count, max_new_words):
+    """
+    Adds the words of `texts` found in at least `min_count` of them to the model's vocabulary, up to `max_new_words` of the most frequent, and counts `texts` in its document frequencies
+
+    Returns: the number of words added
+    """
+    id2word = lda_model.id2word
+    new_dict = corpora.Dictionary(texts)
+    unknown = [(new_dict.dfs[word_id], token) for token, word_id in new_dict.token2id.items() if token not in id2word.token2id]
+    added = set(token for df, token in sorted(unknown, key=lambda item: (-item[0], item[1]))[:max_new_words] if df >= min_count)
+    new_dict.filter_tokens(bad_ids=[new_dict.token2id[token] for _, token in unknown if token not in added])
+
+    num_terms = len(id2word)
+    id2word.merge_with(new_dict)
+    _resize_topics(lda_model, list(range(num_terms)), new_terms=len(id2word) - num_terms)
+    return len(id2word) - num_terms
+
+def _prune_vocabulary(lda_model, no_below=None, keep_n=None):
+    """
+    Removes the words found in fewer than `no_below` documents from the model's vocabulary, then all but the `keep_n` found in the most documents
+
+    Returns: the number of words removed
+    """
+    id2word = lda_model.id2word
+    kept_ids = [word_id for word_id in range(len(id2word)) if no_below is None or id2word.dfs.get(word_id, 0) >= no_below]
+    if keep_n is not None and len(kept_ids) > keep_n:
+        kept_ids = sorted(sorted(kept_ids, key=lambda word_id: -id2word.dfs.get(word_id, 0))[:keep_n])
+
+    removed = len(id2word) - len(kept_ids)
+    if removed:
+        id2word.filter_tokens(good_ids=kept_ids) # Remaining words keep their order when renumbered
+        _resize_topics(lda_model, kept_ids)
+    return removed
+
+def update_lda(texts, model_path='models/lda', stop_words=None, allowed_postags=['NOUN', 'ADJ', 'VERB'], lang='english', min_count=5, max_new_words=1000, no_below=None, keep_n=None, passes=1, verbose=False):
+    """
+    Parameters:
+        - `texts`
+            a list of documents, e.g. the full texts of newly retrieved articles. Documents already folded into the model by an earlier update are skipped.
+        - `model_path`
+            the path at which the LDA model to update is saved
+        - `stop_words`
+            a list of words to be removed from each document in `texts`. By default, the stop words of `lang` are used.
+        - `allowed_postags`
+            a list of the parts of speech to be preserved (e.g ['NOUN', 'ADJ'])
+        - `lang`
+            the language in which the documents are written
+        - `min_count`
+            the number of new documents a word must be found in to be added to the model's vocabulary
+        - `max_new_words`
+            the largest number of words added to the vocabulary by one update, keeping those found in the most new documents
+        - `no_below`
+            the number of documents, across all those the model has seen, a word must be found in to be kept in its vocabulary. By default, this is set to None, which keeps every word.
+        - `keep_n`
+            the largest number of words kept in the model's vocabulary, keeping those found in the most documents. By default, this is set to None, which does not limit it.
+        - `passes`
+            the number of passes over the new documents
+        - `verbose`
+            a boolean specifying whether or not to print updates
+
+    Folds the new documents into the saved model with online variational Bayes updates, instead of training a new model on every document. Documents are preprocessed with the phraser saved with the model, if any. The updated model is saved in place, and its version and update history are recorded (see `model_metadata()`).
+
+    A model saved without the content hashes of the documents it was trained on, such as one saved before `save_lda()` recorded them, cannot tell those documents apart from new ones. Its first update folds in every document in `texts` once, after which they are recorded and skipped.
+    
+    Returns: the updated model
+    """
+    hashes_path = model_path + '.hashes.txt' # Content hashes of the documents the model was trained on or folded in by earlier updates
+    try:
+        with open(hashes_path, encoding='utf-8') as f:
+            known_hashes = set(line.strip() for line in f if line.strip())
+    except OSError:
+        warn('No content hashes saved with {}, so documents it was trained on are folded in again'.format(model_path))
+        known_hashes = set()
+
+    new_texts, new_hashes = [], []
+    for text in texts:
+        text_hash = content_hash(text)
+        if text_hash is not None and text_hash not in known_hashes:
+            known_hashes.add(text_hash)
+            new_texts.append(text)
+            new_hashes.append(text_hash)
+
+    lda_model = LdaModel.load(model_path)
+    if not new_texts:
+        if verbose: print('No new documents to fold into the model')
+        return lda_model
+
+    if stop_words is None:
+        stop_words = stopwords.words(lang)
+    processed = custom_preprocess(new_texts, stop_words=stop_words, allowed_postags=allowed_postags, lang=lang, phraser=load_phraser(model_path))
+
+    words_added = _grow_vocabulary(lda_model, processed, min_count, max_new_words)
+    lda_model.update(form_corpus(processed, lda_model.id2word), passes=passes)
+    words_pruned = _prune_vocabulary(lda_model, no_below=no_below, keep_n=keep_n)
+
+    if verbose:
+        print('Folded {} documents into the model, adding {} words and removing {}'.format(len(new_texts), words_added, words_pruned))
+
+    lda_model.save(model_path)
+    with open(hashes_path, 'a', encoding='utf-8') as f:
+        f.write(''.join(text_hash + '\n' for text_hash in new_hashes))
+
+    metadata = model_metadata(model_path)
+    metadata['version'] += 1
+    metadata['updated'] = datetime.now().isoformat()
+    metadata['documents'] = lda_model.id2word.num_docs
+    metadata['num_terms'] = lda_model.num_terms
+    metadata['num_topics'] = lda_model.num_topics
+    metadata['updates'].append({'version' : metadata['version'], 'updated' : metadata['updated'], 'new_documents' : len(new_texts),
+                                'words_added' : words_added, 'words_pruned' : words_pruned})
+    _write_json(model_path + '.meta.json', metadata)
+
+    return lda_model